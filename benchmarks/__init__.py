@@ -0,0 +1,3 @@
+from .runner import benchmark, compare_results, memory_benchmark, run_benchmarks
+
+__all__ = ['benchmark', 'compare_results', 'memory_benchmark', 'run_benchmarks']
\ No newline at end of file
@@ -0,0 +1,52 @@
+import argparse
+import json
+import sys
+from . import chain_benchmarks, slots_benchmarks, utilities_benchmarks
+from .runner import compare_results, print_comparison, run_benchmarks
+
+
+def main() -> int:
+    """
+    Run the benchmark suite, optionally saving the results and comparing them
+    against a stored baseline.
+
+    Returns:
+        int: Exit code, 1 if any benchmark regressed past the threshold
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Microbenchmarks for the chain and utilities packages.')
+    parser.add_argument('-o', '--output', help='write results to this JSON file')
+    parser.add_argument('-b', '--baseline', help='compare against results stored in this JSON file')
+    parser.add_argument('-t', '--threshold', type=float, default=0.10,
+                        help='allowed slowdown against the baseline as a fraction (default: 0.10)')
+    parser.add_argument('-f', '--filter', help='only run benchmarks whose name contains this')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='samples per benchmark (default: 5)')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.filter, args.repeat)
+
+    for name, ns in sorted(results['results'].items()):
+        print(f"{name:<50} {ns:>12.1f} ns")
+
+    for name, size in sorted(results['memory'].items()):
+        print(f"{name:<50} {size:>12.1f} B")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    entries = compare_results(results, baseline, args.threshold)
+    print()
+    print_comparison(entries)
+
+    return 1 if any(e['regressed'] for e in entries) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,146 @@
+from chain import ChainHelper, DispatchBase, NodeBase
+from chain.node_base import is_dispatch_of_type
+from typing import Any, Callable
+from .runner import benchmark
+
+
+class BenchDispatch(DispatchBase):
+    """Minimal dispatch used by the benchmarks."""
+
+    __slots__ = ()
+
+    def initialize(self, input_data: Any) -> None:
+        """Mark the dispatch valid."""
+        self.make_valid()
+
+
+class NoopNode(NodeBase):
+    """Node that does nothing, so benchmarks measure chain overhead only."""
+
+    __slots__ = ()
+
+    def __init__(self, key: str):
+        """Initialize a new NoopNode instance."""
+        super().__init__()
+        self.set_key(key).set_version('1.0.0')
+
+    def process(self, sender: Any, dispatch: DispatchBase) -> None:
+        """Ignore the dispatch."""
+        pass
+
+
+class ConsumeNode(NoopNode):
+    """Node that consumes every dispatch it receives."""
+
+    __slots__ = ()
+
+    def process(self, sender: Any, dispatch: DispatchBase) -> None:
+        """Consume the dispatch."""
+        dispatch.consume()
+
+
+def make_chain(num_nodes: int, is_event: bool = False, consume_at: int = -1) -> ChainHelper:
+    """
+    Build a chain of no-op nodes, optionally with a consuming node at an index.
+
+    Args:
+        num_nodes: Number of nodes to link
+        is_event: Toggle for event-chain
+        consume_at: Index of the consuming node, or -1 for none
+
+    Returns:
+        ChainHelper: Populated chain
+    """
+    chain = ChainHelper(is_event)
+
+    for i in range(num_nodes):
+        chain.link_node(ConsumeNode(f"node{i}") if i == consume_at else NoopNode(f"node{i}"))
+
+    return chain
+
+
+def make_dispatch(consumable: bool = False) -> BenchDispatch:
+    """
+    Build a valid dispatch.
+
+    Args:
+        consumable: Toggle for making the dispatch consumable
+
+    Returns:
+        BenchDispatch: Valid dispatch
+    """
+    dispatch = BenchDispatch()
+    dispatch.initialize(None)
+
+    if consumable:
+        dispatch.make_consumable()
+
+    return dispatch
+
+
+def _traverse(num_nodes: int, is_event: bool = False, do_debug: bool = False) -> Callable[[], Any]:
+    chain = make_chain(num_nodes, is_event)
+    dispatch = make_dispatch()
+
+    if do_debug:
+        chain.hook_logger(lambda message: None)
+        chain.toggle_debug(True)
+
+    return lambda: chain.traverse(dispatch)
+
+
+def _traverse_consumable(num_nodes: int, consume_at: int) -> Callable[[], Any]:
+    chain = make_chain(num_nodes, consume_at=consume_at)
+
+    return lambda: chain.traverse(make_dispatch(True))
+
+
+for _count in (1, 10, 100, 1000):
+    benchmark(f"chain.traverse.nodes_{_count}")(lambda count=_count: _traverse(count))
+
+benchmark('chain.traverse.event')(lambda: _traverse(1, is_event=True))
+benchmark('chain.traverse.debug_off')(lambda: _traverse(10))
+benchmark('chain.traverse.debug_on')(lambda: _traverse(10, do_debug=True))
+
+# Consumable traversals include building the dispatch, since a consumed dispatch can't be reused
+benchmark('chain.traverse.consume_baseline')(lambda: lambda: make_dispatch(True))
+
+for _label, _index in (('first', 0), ('middle', 50), ('last', 99)):
+    benchmark(f"chain.traverse.consume_{_label}")(lambda index=_index: _traverse_consumable(100, index))
+
+
+@benchmark('chain.link_node.nodes_1000')
+def _link_node() -> Callable[[], Any]:
+    nodes = [NoopNode(f"node{i}") for i in range(1000)]
+
+    def run() -> None:
+        chain = ChainHelper()
+
+        for node in nodes:
+            chain.link_node(node)
+
+    return run
+
+
+@benchmark('chain.dispatch.make_valid')
+def _dispatch_make_valid() -> Callable[[], Any]:
+    return make_dispatch
+
+
+@benchmark('chain.dispatch.set_result_stateful_1000')
+def _set_result_stateful() -> Callable[[], Any]:
+    def run() -> None:
+        dispatch = make_dispatch().make_stateful()
+
+        for i in range(1000):
+            dispatch.set_result(i)
+
+    return run
+
+
+@benchmark('chain.is_dispatch_of_type.classes_50')
+def _is_dispatch_of_type() -> Callable[[], Any]:
+    classes = tuple(type(f"Other{i}", (BenchDispatch,), {}) for i in range(49)) + (BenchDispatch,)
+    dispatch = make_dispatch()
+
+    return lambda: is_dispatch_of_type(dispatch, *classes)
\ No newline at end of file
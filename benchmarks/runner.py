@@ -0,0 +1,188 @@
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+# Registered benchmarks, each a factory that performs setup and returns the callable to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+# Registered memory benchmarks, each a callable that creates one instance to measure
+MEMORY_BENCHMARKS: Dict[str, Callable[[], Any]] = {}
+
+# Number of instances created per memory benchmark
+MEMORY_INSTANCES = 1000
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Callable[[], Any]]], Callable[[], Callable[[], Any]]]:
+    """
+    Register a benchmark factory under the given name. The factory performs any
+    setup and returns a zero-argument callable that is timed.
+
+    Args:
+        name: Unique name of the benchmark
+
+    Returns:
+        Callable: Decorator that registers the factory
+
+    Raises:
+        ValueError: If a benchmark with the same name is already registered.
+    """
+    def decorator(factory: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+
+        BENCHMARKS[name] = factory
+        return factory
+
+    return decorator
+
+
+def memory_benchmark(name: str) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """
+    Register a memory benchmark under the given name. The decorated callable
+    creates one instance, and the benchmark reports the bytes allocated per
+    instance while keeping many of them alive.
+
+    Args:
+        name: Unique name of the benchmark
+
+    Returns:
+        Callable: Decorator that registers the callable
+
+    Raises:
+        ValueError: If a memory benchmark with the same name is already registered.
+    """
+    def decorator(create: Callable[[], Any]) -> Callable[[], Any]:
+        if name in MEMORY_BENCHMARKS:
+            raise ValueError(f"Memory benchmark '{name}' is already registered")
+
+        MEMORY_BENCHMARKS[name] = create
+        return create
+
+    return decorator
+
+
+def measure_memory(create: Callable[[], Any], count: int = MEMORY_INSTANCES) -> float:
+    """
+    Return the average number of bytes allocated per instance by the given
+    callable, measured with tracemalloc while all instances are alive.
+
+    Args:
+        create: Callable that creates one instance
+        count: Number of instances to create
+
+    Returns:
+        float: Bytes allocated per instance
+    """
+    instances = [None] * count
+    create()
+    tracemalloc.start()
+
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+
+        for i in range(count):
+            instances[i] = create()
+
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def run_benchmarks(name_filter: Optional[str] = None, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Run all registered benchmarks whose name contains the filter. Each timed
+    benchmark is auto-ranged to roughly 0.2 seconds per sample and the fastest of
+    `repeat` samples is kept, which is the least noisy estimate of the true cost.
+    Memory benchmarks are run once.
+
+    Args:
+        name_filter: Optional substring benchmark names must contain
+        repeat: Number of samples to take per benchmark
+
+    Returns:
+        Dict[str, Any]: Run metadata, nanoseconds per call and bytes per instance by benchmark name
+    """
+    results = {}
+    memory = {}
+
+    for name, factory in sorted(BENCHMARKS.items()):
+        if name_filter and name_filter not in name:
+            continue
+
+        timer = timeit.Timer(factory())
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number))
+        results[name] = best / number * 1e9
+
+    for name, create in sorted(MEMORY_BENCHMARKS.items()):
+        if name_filter and name_filter not in name:
+            continue
+
+        memory[name] = measure_memory(create)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'repeat': repeat
+        },
+        'results': results,
+        'memory': memory
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare a run against a baseline run, returning every benchmark present in
+    both along with whether it slowed down, or for memory benchmarks grew, by
+    more than the threshold.
+
+    Args:
+        current: Output of run_benchmarks() for the current tree
+        baseline: Output of run_benchmarks() stored earlier
+        threshold: Allowed slowdown as a fraction, e.g. 0.1 for 10%
+
+    Returns:
+        List[Dict[str, Any]]: Comparison entries sorted by benchmark name
+    """
+    ret = []
+
+    for section, unit in (('results', 'ns'), ('memory', 'B')):
+        for name, value in sorted(current.get(section, {}).items()):
+            base_value = baseline.get(section, {}).get(name)
+
+            if base_value is None or base_value <= 0:
+                continue
+
+            change = value / base_value - 1.0
+            ret.append({
+                'name': name,
+                'unit': unit,
+                'baseline': base_value,
+                'current': value,
+                'change': change,
+                'regressed': change > threshold
+            })
+
+    return ret
+
+
+def print_comparison(entries: List[Dict[str, Any]], out=sys.stdout) -> None:
+    """
+    Print comparison entries as an aligned table.
+
+    Args:
+        entries: Output of compare_results()
+        out: Stream to write to
+    """
+    width = max((len(e['name']) for e in entries), default=10)
+
+    for e in entries:
+        flag = 'REGRESSED' if e['regressed'] else ''
+        out.write(f"{e['name']:<{width}}  {e['baseline']:>12.1f} {e['unit']:<2} {e['current']:>12.1f} {e['unit']:<2} "
+                  f"{e['change'] * 100:>+7.1f}%  {flag}\n")
\ No newline at end of file
@@ -0,0 +1,96 @@
+from chain import ChainHelper, DispatchBase, NodeBase
+from typing import Any, Callable, Type
+from utilities import ReturnHelper
+from .chain_benchmarks import NoopNode, make_dispatch
+from .runner import benchmark, memory_benchmark
+
+
+def unslotted(cls: Type) -> Type:
+    """
+    Build a copy of a slotted class that stores its attributes in a __dict__
+    instead, as the class would without __slots__. Used as the comparison point
+    for the slotted classes.
+
+    Args:
+        cls: Slotted class to copy
+
+    Returns:
+        Type: Equivalent class without __slots__
+    """
+    slots = set(cls.__dict__.get('__slots__', ()))
+    namespace = {k: v for k, v in cls.__dict__.items()
+                 if k not in slots and k not in ('__slots__', '__dict__', '__weakref__')}
+
+    return type(cls)(f"Unslotted{cls.__name__}", cls.__bases__, namespace)
+
+
+UnslottedReturnHelper = unslotted(ReturnHelper)
+UnslottedChainHelper = unslotted(ChainHelper)
+UnslottedNodeBase = unslotted(NodeBase)
+
+
+class DictNode(UnslottedNodeBase):
+    """NoopNode equivalent built on the unslotted NodeBase copy."""
+
+    def __init__(self, key: str):
+        """Initialize a new DictNode instance."""
+        super().__init__()
+        self.set_key(key).set_version('1.0.0')
+
+    def process(self, sender: Any, dispatch: DispatchBase) -> None:
+        """Ignore the dispatch."""
+        pass
+
+
+def _return_helper_access(cls: Type) -> Callable[[], Any]:
+    def run() -> None:
+        ret = cls()
+
+        for i in range(10):
+            ret.add_message('message')
+            ret.add_result(i)
+
+        ret.make_good()
+        ret.is_good()
+        ret.has_messages()
+        ret.has_results()
+
+    return run
+
+
+def _node_access(cls: Type) -> Callable[[], Any]:
+    node = cls('node')
+
+    def run() -> None:
+        node.get_key()
+        node.get_version()
+        node.is_valid()
+        node.is_cpu_bound()
+
+    return run
+
+
+def _chain_traverse(chain_cls: Type, node_cls: Type) -> Callable[[], Any]:
+    chain = chain_cls()
+    dispatch = make_dispatch()
+
+    for i in range(10):
+        chain.link_node(node_cls(f"node{i}"))
+
+    return lambda: chain.traverse(dispatch)
+
+
+benchmark('slots.return_helper.access.slotted')(lambda: _return_helper_access(ReturnHelper))
+benchmark('slots.return_helper.access.dict')(lambda: _return_helper_access(UnslottedReturnHelper))
+benchmark('slots.node_base.access.slotted')(lambda: _node_access(NoopNode))
+benchmark('slots.node_base.access.dict')(lambda: _node_access(DictNode))
+benchmark('slots.chain_helper.traverse.slotted')(lambda: _chain_traverse(ChainHelper, NoopNode))
+benchmark('slots.chain_helper.traverse.dict')(lambda: _chain_traverse(UnslottedChainHelper, DictNode))
+
+memory_benchmark('slots.return_helper.memory.slotted')(ReturnHelper)
+memory_benchmark('slots.return_helper.memory.dict')(UnslottedReturnHelper)
+memory_benchmark('slots.node_base.memory.slotted')(lambda: NoopNode('node'))
+memory_benchmark('slots.node_base.memory.dict')(lambda: DictNode('node'))
+memory_benchmark('slots.chain_helper.memory.slotted')(ChainHelper)
+memory_benchmark('slots.chain_helper.memory.dict')(UnslottedChainHelper)
+memory_benchmark('slots.dispatch_base.memory.slotted')(make_dispatch)
\ No newline at end of file
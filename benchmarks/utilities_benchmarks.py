@@ -0,0 +1,58 @@
+from typing import Any, Callable
+from utilities import ReturnHelper
+from .runner import benchmark
+
+
+@benchmark('utilities.return_helper.construct')
+def _construct() -> Callable[[], Any]:
+    return ReturnHelper
+
+
+@benchmark('utilities.return_helper.add_message_100')
+def _add_message() -> Callable[[], Any]:
+    def run() -> None:
+        ret = ReturnHelper()
+
+        for i in range(100):
+            ret.add_message('message')
+
+        ret.make_good()
+
+    return run
+
+
+@benchmark('utilities.return_helper.add_messages_100')
+def _add_messages() -> Callable[[], Any]:
+    messages = ['message'] * 100
+
+    def run() -> None:
+        ret = ReturnHelper()
+        ret.add_messages(messages)
+        ret.has_messages()
+
+    return run
+
+
+@benchmark('utilities.return_helper.add_result_100')
+def _add_result() -> Callable[[], Any]:
+    def run() -> None:
+        ret = ReturnHelper()
+
+        for i in range(100):
+            ret.add_result(i)
+
+        ret.is_good()
+
+    return run
+
+
+@benchmark('utilities.return_helper.add_results_100')
+def _add_results() -> Callable[[], Any]:
+    results = list(range(100))
+
+    def run() -> None:
+        ret = ReturnHelper()
+        ret.add_results(results)
+        ret.has_results()
+
+    return run
\ No newline at end of file
@@ -1,5 +1,35 @@
 from .node_base import NodeBase
+from .async_node_base import AsyncNodeBase
+from .dispatch_trace import DispatchTrace
 from .dispatch_base import DispatchBase
+from .chain_observer import ChainObserver
+from .chain_metrics import ChainMetrics
+from .circuit_breaker import CircuitBreaker
+from .chrome_trace import ChromeTraceRecorder
+from .debug_pipeline import DebugPipeline
+from .flight_recorder import FlightRecorder
+from .traversal_outcome import TraversalOutcome
+from .compiled_chain import CompiledChain
 from .chain_helper import ChainHelper
+from .dispatch_bus import DispatchBus
+from .sharded_executor import ShardedExecutor
+from .batching_stage import BatchingStage
 
-__all__ = ['NodeBase', 'DispatchBase', 'ChainHelper']
\ No newline at end of file
+__all__ = [
+    'NodeBase',
+    'AsyncNodeBase',
+    'DispatchTrace',
+    'DispatchBase',
+    'ChainObserver',
+    'ChainMetrics',
+    'CircuitBreaker',
+    'ChromeTraceRecorder',
+    'DebugPipeline',
+    'FlightRecorder',
+    'TraversalOutcome',
+    'CompiledChain',
+    'ChainHelper',
+    'DispatchBus',
+    'ShardedExecutor',
+    'BatchingStage',
+]
\ No newline at end of file
@@ -0,0 +1,124 @@
+from .node_base import NodeBase
+from .dispatch_base import DispatchBase
+from typing import List, Dict, Tuple, Type
+
+
+class AdaptiveOrder:
+    """
+    Class to track how often each node consumes each dispatch class and how long
+    it takes, and to suggest a traversal order that reaches likely consumers
+    sooner. Counters aren't synchronized, so concurrent traversals can lose the
+    odd sample, which is fine for a heuristic.
+    """
+
+    def __init__(self, interval: int = 1000):
+        """
+        Create a new instance of AdaptiveOrder class.
+
+        Args:
+            interval: Number of traversals of a dispatch class between reorders
+
+        Raises:
+            ValueError: If interval is less than 1.
+        """
+        if interval < 1:
+            raise ValueError("Interval to AdaptiveOrder() must be a positive integer")
+
+        self._interval: int = interval
+        self._counts: Dict[Type[DispatchBase], int] = {}
+        self._stats: Dict[Tuple[Type[DispatchBase], str], List[int]] = {}
+
+    def get_stats(self, dispatch_type: Type[DispatchBase]) -> Dict[str, Dict[str, int]]:
+        """
+        Return the decayed observations for the given dispatch class.
+
+        Args:
+            dispatch_type: Dispatch class to report on
+
+        Returns:
+            Dict[str, Dict[str, int]]: Calls, consumes and total nanoseconds by node key
+        """
+        ret = {}
+
+        for (stat_type, key), (calls, consumes, total_ns) in list(self._stats.items()):
+            if stat_type is dispatch_type:
+                ret[key] = {'calls': calls, 'consumes': consumes, 'total_ns': total_ns}
+
+        return ret
+
+    def record(self, dispatch_type: Type[DispatchBase], key: str, elapsed_ns: int, consumed: bool) -> None:
+        """
+        Record a single node visit.
+
+        Args:
+            dispatch_type: Class of the dispatch that was processed
+            key: Key of the node that processed it
+            elapsed_ns: Time spent in the node, in nanoseconds
+            consumed: Whether the node consumed the dispatch
+        """
+        stats = self._stats.get((dispatch_type, key))
+
+        if stats is None:
+            stats = self._stats[(dispatch_type, key)] = [0, 0, 0]
+
+        stats[0] += 1
+        stats[2] += elapsed_ns
+
+        if consumed:
+            stats[1] += 1
+
+    def reorder(self, dispatch_type: Type[DispatchBase], nodes: List[Tuple[int, NodeBase]]) -> List[NodeBase]:
+        """
+        Sort nodes within their priority band by consume probability divided by
+        average cost, which reduces to consumes per nanosecond spent. Nodes never
+        observed go after the nodes known to consume and ahead of those known not
+        to, so they get measured without delaying proven consumers. Ties keep their
+        current order, and all observations for the class are then halved so the
+        order follows shifts in traffic; a node whose counters decay to zero keeps
+        its place among observed nodes.
+
+        Args:
+            dispatch_type: Dispatch class the order is for
+            nodes: Priority band and node pairs, in current traversal order
+
+        Returns:
+            List[NodeBase]: Nodes in suggested traversal order
+        """
+        def sort_key(entry: Tuple[int, NodeBase]) -> Tuple[int, float, bool]:
+            stats = self._stats.get((dispatch_type, entry[1].get_key()))
+
+            if stats is None:
+                return entry[0], 0.0, False
+
+            return entry[0], -(stats[1] / max(stats[2], 1)), True
+
+        ret = [node for _, node in sorted(nodes, key=sort_key)]
+
+        for (stat_type, _), stats in list(self._stats.items()):
+            if stat_type is dispatch_type:
+                stats[0] >>= 1
+                stats[1] >>= 1
+                stats[2] >>= 1
+
+        return ret
+
+    def tick(self, dispatch_type: Type[DispatchBase]) -> bool:
+        """
+        Count a traversal of the given dispatch class.
+
+        Args:
+            dispatch_type: Class of the dispatch that was traversed
+
+        Returns:
+            bool: True if the class is due to be reordered, False otherwise
+        """
+        count = self._counts.get(dispatch_type, 0) + 1
+
+        if count >= self._interval:
+            self._counts[dispatch_type] = 0
+
+            return True
+
+        self._counts[dispatch_type] = count
+
+        return False
\ No newline at end of file
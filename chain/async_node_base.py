@@ -0,0 +1,26 @@
+from abc import abstractmethod
+from typing import Any
+from .dispatch_base import DispatchBase
+from .node_base import NodeBase
+
+
+class AsyncNodeBase(NodeBase):
+    """
+    Abstract class to provide contract for nodes that process dispatches as
+    coroutines. Async nodes are only awaited by ChainHelper.atraverse(); the
+    synchronous traversal methods raise TypeError for dispatches routed to an
+    async node, and ChainHelper.freeze() refuses chains containing one.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    async def process(self, sender: Any, dispatch: DispatchBase) -> None:
+        """
+        Abstract coroutine that handles processing of a provided dispatch.
+
+        Args:
+            sender: Sender data, optional and thus can be None
+            dispatch: Dispatch object to process
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,208 @@
+import threading
+import time
+from .dispatch_base import DispatchBase
+from .chain_helper import ChainHelper
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class BatchingStage:
+    """
+    Class to accumulate dispatches in front of a chain and traverse them in
+    batches with ChainHelper.traverse_batch(). A batch is handed to the chain
+    once it reaches the maximum size, or once its oldest dispatch has waited for
+    the maximum delay. Batches are traversed one at a time on a background
+    thread, in submission order.
+
+    Submitting never blocks, so a chain that can't keep up lets the backlog of
+    pending dispatches grow; put a DispatchBus in front to bound it.
+    """
+
+    def __init__(self, chain: ChainHelper, max_size: int = 100, max_delay: float = 0.01, sender: Any = None,
+                 error_handler: Optional[Callable[[List[DispatchBase], Exception], None]] = None):
+        """
+        Create a new instance of BatchingStage class and start its worker thread.
+
+        Args:
+            chain: Chain to traverse batches with
+            max_size: Maximum number of dispatches per batch
+            max_delay: Maximum number of seconds a dispatch waits for its batch to fill
+            sender: Optional sender data to pass to linked nodes
+            error_handler: Optional callable that receives batches whose traversal raised, and the exception;
+                exceptions raised by the handler itself are counted and otherwise ignored
+
+        Raises:
+            ValueError: If max_size is less than 1 or max_delay is negative.
+        """
+        if max_size < 1:
+            raise ValueError("Maximum size to BatchingStage() must be a positive integer")
+
+        if max_delay < 0:
+            raise ValueError("Maximum delay to BatchingStage() must not be negative")
+
+        self._chain: ChainHelper = chain
+        self._max_size: int = max_size
+        self._max_delay_ns: int = int(max_delay * 1e9)
+        self._sender: Any = sender
+        self._error_handler: Optional[Callable[[List[DispatchBase], Exception], None]] = error_handler
+        self._pending: List[Tuple[DispatchBase, int]] = []
+        self._changed: threading.Condition = threading.Condition()
+        self._in_flight: int = 0
+        self._is_flushing: bool = False
+        self._is_stopping: bool = False
+        self._batches: int = 0
+        self._dispatches: int = 0
+        self._max_batch: int = 0
+        self._errors: int = 0
+        self._handler_errors: int = 0
+        self._thread: threading.Thread = threading.Thread(target=self._run, name='BatchingStage', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'BatchingStage':
+        """Return self so the stage can be used as a context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the stage when leaving the context."""
+        self.stop()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Hand the pending dispatches to the chain without waiting for the batch to
+        fill, and wait until they have been traversed.
+
+        Args:
+            timeout: Optional number of seconds to wait
+
+        Returns:
+            bool: True if no dispatches are pending, False if the timeout expired first
+        """
+        with self._changed:
+            self._is_flushing = True
+            self._changed.notify_all()
+
+            return self._changed.wait_for(lambda: not self._pending and self._in_flight == 0, timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return counters for the stage.
+
+        Returns:
+            Dict[str, int]: Pending dispatches, traversed batches and dispatches, batch sizes and error counts
+        """
+        with self._changed:
+            return {
+                'pending': len(self._pending),
+                'batches': self._batches,
+                'dispatches': self._dispatches,
+                'max_batch': self._max_batch,
+                'mean_batch': self._dispatches // self._batches if self._batches > 0 else 0,
+                'errors': self._errors,
+                'handler_errors': self._handler_errors
+            }
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting dispatches and stop the worker thread after it traverses
+        the dispatches already pending.
+
+        Args:
+            timeout: Optional number of seconds to wait for the worker
+        """
+        with self._changed:
+            self._is_stopping = True
+            self._changed.notify_all()
+
+        self._thread.join(timeout)
+
+    def submit(self, dispatch: DispatchBase) -> None:
+        """
+        Add a dispatch to the current batch.
+
+        Args:
+            dispatch: DispatchBase object to distribute to linked nodes
+
+        Raises:
+            RuntimeError: If the stage has been stopped
+        """
+        with self._changed:
+            if self._is_stopping:
+                raise RuntimeError("Attempted to submit to a stopped BatchingStage")
+
+            self._pending.append((dispatch, time.perf_counter_ns()))
+
+            if len(self._pending) == 1 or len(self._pending) == self._max_size:
+                self._changed.notify_all()
+
+    def _next_batch(self) -> Optional[List[DispatchBase]]:
+        """
+        Wait until a batch is due and take it off the pending dispatches.
+
+        Returns:
+            Optional[List[DispatchBase]]: Next batch, or None once stopped with nothing pending
+        """
+        with self._changed:
+            while True:
+                if not self._pending:
+                    self._is_flushing = False
+
+                    if self._is_stopping:
+                        return None
+
+                    self._changed.wait()
+
+                    continue
+
+                if len(self._pending) >= self._max_size or self._is_flushing or self._is_stopping:
+                    break
+
+                remaining_ns = self._pending[0][1] + self._max_delay_ns - time.perf_counter_ns()
+
+                if remaining_ns <= 0:
+                    break
+
+                self._changed.wait(remaining_ns / 1e9)
+
+            batch = [dispatch for dispatch, _ in self._pending[:self._max_size]]
+            del self._pending[:self._max_size]
+            self._in_flight = len(batch)
+
+            return batch
+
+    def _run(self) -> None:
+        """
+        Worker loop that traverses batches until stopped and drained.
+        """
+        while True:
+            batch = self._next_batch()
+
+            if batch is None:
+                return
+
+            is_processed = False
+            is_handled = True
+
+            try:
+                self._chain.traverse_batch(batch, self._sender)
+                is_processed = True
+            except Exception as e:
+                if self._error_handler is not None:
+                    try:
+                        self._error_handler(batch, e)
+                    except Exception:
+                        is_handled = False
+            finally:
+                with self._changed:
+                    self._batches += 1
+                    self._dispatches += len(batch)
+                    self._in_flight = 0
+
+                    if len(batch) > self._max_batch:
+                        self._max_batch = len(batch)
+
+                    if not is_processed:
+                        self._errors += 1
+
+                    if not is_handled:
+                        self._handler_errors += 1
+
+                    self._changed.notify_all()
\ No newline at end of file
@@ -0,0 +1,301 @@
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+from .chain_helper import ChainHelper
+from .dispatch_base import DispatchBase
+from .node_base import NodeBase
+
+# Percentiles reported by the load generator
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# Linear sub-buckets per power-of-two latency range, as a bit count; 7 bits keeps percentiles within 1%
+SUB_BUCKET_BITS = 7
+
+# Number of latency buckets, enough for any 64-bit duration
+NUM_BUCKETS = (64 - SUB_BUCKET_BITS + 1) << SUB_BUCKET_BITS
+
+
+class SyntheticDispatch(DispatchBase):
+    """
+    Dispatch generated by the load generator.
+    """
+
+    def initialize(self, input_data: Any) -> None:
+        """
+        Mark the dispatch valid, making it consumable if requested.
+
+        Args:
+            input_data: Truthy to make the dispatch consumable
+        """
+        if input_data:
+            self.make_consumable()
+
+        self.make_valid()
+
+
+class SyntheticNode(NodeBase):
+    """
+    Node that busy-waits for a sampled cost and consumes with a fixed probability.
+    """
+
+    def __init__(self, key: str, cost: Callable[[], int], consume_prob: float, rng: random.Random):
+        """
+        Initialize a new SyntheticNode instance.
+
+        Args:
+            key: Node key
+            cost: Sampler returning the cost of one call in nanoseconds
+            consume_prob: Probability of consuming each dispatch
+            rng: Random source used for consume decisions
+        """
+        super().__init__()
+        self.set_key(key).set_version('1.0.0')
+        self._cost = cost
+        self._consume_prob = consume_prob
+        self._rng = rng
+
+    def process(self, sender: Any, dispatch: DispatchBase) -> None:
+        """
+        Spin for the sampled cost, then possibly consume the dispatch.
+
+        Args:
+            sender: Sender data, unused
+            dispatch: Dispatch object to process
+        """
+        until = time.perf_counter_ns() + self._cost()
+
+        while time.perf_counter_ns() < until:
+            pass
+
+        if self._consume_prob > 0.0 and self._rng.random() < self._consume_prob:
+            dispatch.consume()
+
+
+def make_cost_sampler(distribution: str, mean_ns: int, rng: random.Random) -> Callable[[], int]:
+    """
+    Build a sampler for node cost in nanoseconds.
+
+    Args:
+        distribution: One of 'fixed', 'uniform' or 'exponential'
+        mean_ns: Mean cost in nanoseconds
+        rng: Random source
+
+    Returns:
+        Callable[[], int]: Sampler returning a cost in nanoseconds
+
+    Raises:
+        ValueError: If the distribution is unknown.
+    """
+    if mean_ns <= 0:
+        return lambda: 0
+
+    if distribution == 'fixed':
+        return lambda: mean_ns
+
+    if distribution == 'uniform':
+        return lambda: int(rng.uniform(0, 2 * mean_ns))
+
+    if distribution == 'exponential':
+        return lambda: int(rng.expovariate(1.0 / mean_ns))
+
+    raise ValueError(f"Unknown cost distribution: {distribution}")
+
+
+def build_chain(depth: int, distribution: str, mean_ns: int, consume_prob: float, seed: int) -> ChainHelper:
+    """
+    Build a synthetic chain.
+
+    Args:
+        depth: Number of nodes
+        distribution: Cost distribution of each node
+        mean_ns: Mean cost of each node in nanoseconds
+        consume_prob: Probability of each node consuming a dispatch
+        seed: Seed for the random sources
+
+    Returns:
+        ChainHelper: Populated chain
+    """
+    chain = ChainHelper()
+
+    for i in range(depth):
+        rng = random.Random(seed + i)
+        chain.link_node(SyntheticNode(f"node{i}", make_cost_sampler(distribution, mean_ns, rng), consume_prob, rng))
+
+    return chain
+
+
+def _bucket_index(value: int) -> int:
+    """
+    Return the latency bucket of a value. Values below twice the sub-bucket
+    count get a bucket each; above that, each power-of-two range is split into
+    the same number of linear sub-buckets.
+
+    Args:
+        value: Non-negative value in nanoseconds
+
+    Returns:
+        int: Bucket index below NUM_BUCKETS
+    """
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+
+    if shift <= 0:
+        return value
+
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """
+    Return the highest value that falls into a latency bucket.
+
+    Args:
+        index: Bucket index returned by _bucket_index()
+
+    Returns:
+        int: Upper bound of the bucket in nanoseconds
+    """
+    shift = (index >> SUB_BUCKET_BITS) - 1
+
+    if shift <= 0:
+        return index
+
+    return ((index - (shift << SUB_BUCKET_BITS) + 1) << shift) - 1
+
+
+def percentile(buckets: List[int], count: int, pct: float) -> int:
+    """
+    Return the nearest-rank percentile of the values counted in a histogram.
+
+    Args:
+        buckets: Counts indexed by _bucket_index()
+        count: Total of all counts
+        pct: Percentile between 0 and 100
+
+    Returns:
+        int: Upper bound of the bucket holding the percentile, or 0 if there are no values
+    """
+    if not count:
+        return 0
+
+    rank = min(max(1, math.ceil(pct / 100.0 * count)), count)
+    seen = 0
+
+    for index, bucket_count in enumerate(buckets):
+        seen += bucket_count
+
+        if seen >= rank:
+            return _bucket_value(index)
+
+    return 0
+
+
+def run_load(chain: ChainHelper, duration: float, rate: Optional[float], consumable: bool) -> Dict[str, Any]:
+    """
+    Drive the chain for the given duration and count latencies in a fixed-size
+    histogram, so long runs don't grow memory. With a rate the load is open-loop:
+    dispatches are scheduled at fixed intervals and latency is measured from the
+    scheduled time, so time spent waiting behind slow traversals is counted.
+    Without a rate the load is closed-loop and latency covers the traversal alone.
+
+    Args:
+        chain: Chain to traverse
+        duration: Run time in seconds
+        rate: Target dispatches per second, or None for maximum rate
+        consumable: Toggle for making dispatches consumable
+
+    Returns:
+        Dict[str, Any]: Dispatch count, elapsed time, throughput and latency percentiles
+    """
+    buckets = [0] * NUM_BUCKETS
+    max_ns = 0
+    interval_ns = int(1e9 / rate) if rate else 0
+    start = time.perf_counter_ns()
+    end = start + int(duration * 1e9)
+    scheduled = start
+    now = start
+
+    while now < end:
+        if interval_ns:
+            wait = scheduled - time.perf_counter_ns()
+
+            if wait > 1_000_000:
+                time.sleep((wait - 500_000) / 1e9)
+
+            while time.perf_counter_ns() < scheduled:
+                pass
+
+            began = scheduled
+            scheduled += interval_ns
+        else:
+            began = time.perf_counter_ns()
+
+        dispatch = SyntheticDispatch()
+        dispatch.initialize(consumable)
+        chain.traverse(dispatch)
+        now = time.perf_counter_ns()
+        latency = now - began
+        buckets[_bucket_index(latency)] += 1
+
+        if latency > max_ns:
+            max_ns = latency
+
+    elapsed = (now - start) / 1e9
+    count = sum(buckets)
+
+    ret = {
+        'dispatches': count,
+        'elapsed_s': elapsed,
+        'throughput': count / elapsed if elapsed > 0 else 0.0,
+        'latency_us': {f"p{pct:g}": percentile(buckets, count, pct) / 1000.0 for pct in PERCENTILES}
+    }
+    ret['latency_us']['max'] = max_ns / 1000.0
+
+    return ret
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point for the load generator.
+
+    Args:
+        argv: Optional argument list, defaults to sys.argv
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(prog='python -m chain.bench', description='Load generator for synthetic chains.')
+    parser.add_argument('-n', '--depth', type=int, default=10, help='number of nodes in the chain (default: 10)')
+    parser.add_argument('-c', '--cost-us', type=float, default=0.0, help='mean node cost in microseconds (default: 0)')
+    parser.add_argument('--cost-dist', choices=('fixed', 'uniform', 'exponential'), default='fixed',
+                        help='node cost distribution (default: fixed)')
+    parser.add_argument('-p', '--consume-prob', type=float, default=0.0,
+                        help='probability of each node consuming a dispatch; above 0 makes dispatches consumable')
+    parser.add_argument('-r', '--rate', type=float, help='target dispatches per second (open-loop); omit for max rate')
+    parser.add_argument('-d', '--duration', type=float, default=5.0, help='run time in seconds (default: 5)')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='random seed (default: 0)')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    chain = build_chain(args.depth, args.cost_dist, int(args.cost_us * 1000), args.consume_prob, args.seed)
+    report = run_load(chain, args.duration, args.rate, args.consume_prob > 0.0)
+    report['mode'] = 'open' if args.rate else 'closed'
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"mode:       {report['mode']}-loop")
+        print(f"dispatches: {report['dispatches']}")
+        print(f"throughput: {report['throughput']:.1f}/s")
+
+        for name, value in report['latency_us'].items():
+            print(f"{name + ':':<11} {value:.1f} us")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
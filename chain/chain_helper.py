@@ -1,13 +1,125 @@
+import asyncio
+import bisect
+import threading
+import time
+from concurrent.futures import Executor, TimeoutError as FutureTimeoutError, wait
+from .adaptive_order import AdaptiveOrder
+from .chain_metrics import ChainMetrics
+from .circuit_breaker import CircuitBreaker
+from .chain_observer import ChainObserver, OUTCOME_PROCESSED, OUTCOME_CONSUMED, OUTCOME_ERROR
 from .node_base import NodeBase
+from .async_node_base import AsyncNodeBase
 from .dispatch_base import DispatchBase
-from typing import List, Any, Optional, Dict, Callable
+from .dispatch_trace import TRACE_NODE_ENTER, TRACE_NODE_EXIT, TRACE_CONSUMED, TRACE_BYPASSED
+from .compiled_chain import CompiledChain
+from .debug_pipeline import (DebugPipeline, format_debug_record, DEBUG_MESSAGE, DEBUG_NO_NODES, DEBUG_INVALID_DISPATCH,
+                             DEBUG_CONSUMED_DISPATCH, DEBUG_UNHANDLED_DISPATCH, DEBUG_SEND, DEBUG_SEND_EVENT,
+                             DEBUG_SUBMIT, DEBUG_CONSUMED_BY, DEBUG_INVALID_NODE, DEBUG_EVENT_NODE,
+                             DEBUG_DUPLICATE_NODE, DEBUG_LINK_NODE, DEBUG_REPLACE_INVALID, DEBUG_REPLACE_FAILED,
+                             DEBUG_REPLACE_NODE, DEBUG_UNLINK_MISSING, DEBUG_UNLINK_NODE, DEBUG_DEADLINE,
+                             DEBUG_CIRCUIT_OPEN)
+from .traversal_outcome import TraversalOutcome
+from typing import List, Any, Optional, Dict, Callable, Iterable, Tuple, Type
+
+
+def _process_remote(node: NodeBase, sender: Any, dispatch: DispatchBase) -> Tuple[List[Any], bool]:
+    """
+    Run a node against a copy of the dispatch inside a worker process and return
+    what needs merging back into the caller's dispatch.
+
+    Args:
+        node: Node to run
+        sender: Sender data to pass to node
+        dispatch: Worker-side copy of the dispatch
+
+    Returns:
+        Tuple[List[Any], bool]: Results set by the node and whether it consumed the dispatch
+    """
+    results = dispatch.get_results() or []
+    count = len(results)
+    last = results[-1] if count > 0 else None
+
+    node.process(sender, dispatch)
+
+    results = dispatch.get_results() or []
+
+    if dispatch.is_stateful():
+        results = results[count:]
+    elif count > 0 and results and results[-1] is last:
+        results = []
+
+    return list(results), dispatch.is_consumed()
+
+
+def _merge_remote(dispatch: DispatchBase, remote: Tuple[List[Any], bool]) -> None:
+    """
+    Apply the results and consumption reported by _process_remote() to the
+    caller's dispatch.
+
+    Args:
+        dispatch: Caller-side dispatch
+        remote: Value returned by _process_remote()
+    """
+    results, is_consumed = remote
+
+    for result in results:
+        dispatch.set_result(result)
+
+    if is_consumed:
+        dispatch.consume()
+
+
+def _get_deadline(budget_ns: Optional[int]) -> Optional[int]:
+    """
+    Convert a traversal budget into a time.perf_counter_ns() deadline.
+
+    Args:
+        budget_ns: Optional time budget, in nanoseconds
+
+    Returns:
+        Optional[int]: Deadline, or None without a budget
+
+    Raises:
+        ValueError: If budget_ns is negative
+    """
+    if budget_ns is None:
+        return None
+
+    if budget_ns < 0:
+        raise ValueError("Budget to traverse() must not be negative")
+
+    return time.perf_counter_ns() + budget_ns
+
+
+def _get_timeout(deadline: Optional[int]) -> Optional[float]:
+    """
+    Return the seconds left until a deadline, for waiting on executor futures.
+
+    Args:
+        deadline: Optional time.perf_counter_ns() deadline
+
+    Returns:
+        Optional[float]: Seconds left, or None without a deadline
+    """
+    if deadline is None:
+        return None
+
+    return max(deadline - time.perf_counter_ns(), 0) / 1e9
 
 
 class ChainHelper:
     """
     Class to maintain groups (chains) of nodes and send events to them.
+
+    Instances can be copied and pickled; the copy gets its own lock and empty
+    route caches. Attached observers, executors and debug pipelines are copied
+    along with the chain, so they must support copying or pickling themselves.
     """
 
+    __slots__ = ('_nodes', '_order', '_ranks', '_sequence', '_lock', '_routes', '_async_routes', '_adaptive',
+                 '_adaptive_routes', '_observers', '_metrics', '_breaker', '_is_event', '_do_debug', '_logger',
+                 '_pipeline', '_executor', '_process_executor', '__weakref__')
+
     def __init__(self, is_event: bool = False, do_debug: bool = False):
         """
         Create a new instance of ChainHelper class. If set as an event-chain,
@@ -17,13 +129,165 @@ class ChainHelper:
             is_event: Toggle for event-chain
             do_debug: Toggle for sending debug messages
         """
-        self._nodes: List[NodeBase] = []
+        self._nodes: Dict[str, NodeBase] = {}
+        self._order: List[Tuple[int, int, str]] = []
+        self._ranks: Dict[str, Tuple[int, int]] = {}
+        self._sequence: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._routes: Dict[Type[DispatchBase], List[NodeBase]] = {}
+        self._async_routes: Dict[Type[DispatchBase], List[NodeBase]] = {}
+        self._adaptive: Optional[AdaptiveOrder] = None
+        self._adaptive_routes: Dict[Type[DispatchBase], List[NodeBase]] = {}
+        self._observers: Tuple[ChainObserver, ...] = ()
+        self._metrics: Optional[ChainMetrics] = None
+        self._breaker: Optional[CircuitBreaker] = None
         self._is_event: bool = is_event
         self._do_debug: bool = False
         self._logger: Optional[Callable[[str], None]] = None
+        self._pipeline: Optional[DebugPipeline] = None
+        self._executor: Optional[Executor] = None
+        self._process_executor: Optional[Executor] = None
 
         self.toggle_debug(do_debug)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state to copy or pickle, leaving out the lock and route caches."""
+        return {name: getattr(self, name) for name in self.__slots__
+                if name not in ('_lock', '_routes', '_async_routes', '_adaptive_routes', '__weakref__')}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a copied or unpickled state with a new lock and empty route caches."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._lock = threading.Lock()
+        self._clear_routes()
+
+    def attach_observer(self, observer: ChainObserver) -> 'ChainHelper':
+        """
+        Attach an observer that is told about every node visit and traversal made
+        through traverse() and traverse_many(). While any observer is attached the
+        chain times each node call, so traversals cost slightly more.
+
+        Args:
+            observer: ChainObserver object to attach
+
+        Returns:
+            ChainHelper: Self for method chaining
+        """
+        if observer not in self._observers:
+            self._observers = self._observers + (observer,)
+
+        return self
+
+    def detach_observer(self, observer: ChainObserver) -> 'ChainHelper':
+        """
+        Detach a previously attached observer.
+
+        Args:
+            observer: ChainObserver object to detach
+
+        Returns:
+            ChainHelper: Self for method chaining
+        """
+        self._observers = tuple(o for o in self._observers if o is not observer)
+        return self
+
+    def set_executor(self, executor: Optional[Executor]) -> 'ChainHelper':
+        """
+        Set the executor used by traverse_parallel() to run nodes concurrently,
+        normally a ThreadPoolExecutor. The chain doesn't take ownership of the
+        executor, so shutting it down is left to the caller.
+
+        Args:
+            executor: Executor to submit nodes to, or None to run them serially
+
+        Returns:
+            ChainHelper: Self for method chaining
+        """
+        self._executor = executor
+        return self
+
+    def set_process_executor(self, executor: Optional[Executor]) -> 'ChainHelper':
+        """
+        Set the executor used by traverse_parallel() to run nodes marked as
+        CPU-bound, normally a ProcessPoolExecutor. Workers receive a copy of the
+        dispatch and any results or consumption are merged back into the original.
+        If the sender is the chain itself, workers receive None as the sender.
+
+        Args:
+            executor: Executor to submit CPU-bound nodes to, or None to disable
+
+        Returns:
+            ChainHelper: Self for method chaining
+        """
+        self._process_executor = executor
+        return self
+
+    def toggle_adaptive(self, do_adapt: bool, interval: int = 1000) -> 'ChainHelper':
+        """
+        Toggle adaptive ordering for consumable dispatches. While enabled, the chain
+        records which nodes consume each dispatch class and how long each node
+        takes, and every `interval` traversals of a class reorders its nodes within
+        their priority band so likely, cheap consumers are visited first.
+        Non-consumable dispatches always keep the configured order.
+
+        Args:
+            do_adapt: Toggle for adaptive ordering
+            interval: Number of traversals of a dispatch class between reorders
+
+        Returns:
+            ChainHelper: Self for method chaining
+        """
+        self._adaptive = AdaptiveOrder(interval) if do_adapt else None
+        self._adaptive_routes = {}
+        return self
+
+    def toggle_metrics(self, do_metrics: bool) -> 'ChainHelper':
+        """
+        Toggle the built-in metrics collection, which counts calls, consumptions
+        and exceptions and keeps latency histograms for each node and for whole
+        traversals. Turning metrics on again starts from empty counters.
+
+        Args:
+            do_metrics: Toggle for collecting metrics
+
+        Returns:
+            ChainHelper: Self for method chaining
+        """
+        if self._metrics is not None:
+            self.detach_observer(self._metrics)
+            self._metrics = None
+
+        if do_metrics:
+            self._metrics = ChainMetrics()
+            self.attach_observer(self._metrics)
+
+        return self
+
+    def set_circuit_breaker(self, breaker: Optional[CircuitBreaker]) -> 'ChainHelper':
+        """
+        Set the circuit breaker that traverse(), traverse_isolated() and
+        traverse_many() consult before calling each node, bypassing nodes whose
+        circuit is open. The breaker is attached as an observer to learn about
+        node failures and latencies. Pass None to remove it.
+
+        Args:
+            breaker: CircuitBreaker object, or None
+
+        Returns:
+            ChainHelper: Self for method chaining
+        """
+        if self._breaker is not None:
+            self.detach_observer(self._breaker)
+
+        self._breaker = breaker
+
+        if breaker is not None:
+            self.attach_observer(breaker)
+
+        return self
+
     def toggle_debug(self, do_debug: bool) -> 'ChainHelper':
         """
         Toggle the use of debug messages by this instance.
@@ -37,16 +301,64 @@ class ChainHelper:
         self._do_debug = do_debug
         return self
 
+    def freeze(self) -> CompiledChain:
+        """
+        Snapshot the currently linked nodes into a CompiledChain. The snapshot
+        picks its traversal plan once and is unaffected by later changes to this
+        chain, including toggling debug messages or linking nodes.
+
+        Attached observers, including built-in metrics, and the circuit breaker
+        are carried over, and make the snapshot time each node call like
+        traverse() does. Adaptive ordering is not: the snapshot keeps the
+        priority order the nodes were linked with.
+
+        Returns:
+            CompiledChain: Immutable snapshot of the chain
+
+        Raises:
+            TypeError: If an AsyncNodeBase node is linked
+        """
+        with self._lock:
+            nodes = self._get_ordered_nodes()
+
+        return CompiledChain(nodes, self._is_event, self._do_debug, self._logger, self._pipeline, self._observers,
+                             self._breaker)
+
+    def get_node(self, key: str) -> Optional[NodeBase]:
+        """
+        Return the linked node with the given key.
+
+        Args:
+            key: Key of the node to return
+
+        Returns:
+            Optional[NodeBase]: Linked node, or None if no node has the key
+        """
+        return self._nodes.get(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the built-in metrics. See ChainMetrics.get_stats()
+        for the layout.
+
+        Returns:
+            Dict[str, Any]: Metrics snapshot, empty if metrics are disabled
+        """
+        if self._metrics is None:
+            return {}
+
+        return self._metrics.get_stats()
+
     def get_node_list(self) -> List[Dict[str, str]]:
         """
-        Return the full list of nodes linked to the chain.
+        Return the full list of nodes linked to the chain, in traversal order.
 
         Returns:
             List[Dict[str, str]]: List of node information
         """
         ret = []
 
-        for node in self._nodes:
+        for node in self._get_ordered_nodes():
             ret.append({
                 'key': node.get_key(),
                 'version': node.get_version()
@@ -54,6 +366,18 @@ class ChainHelper:
 
         return ret
 
+    def has_node(self, key: str) -> bool:
+        """
+        Return whether a node with the given key is linked to the chain.
+
+        Args:
+            key: Key of the node to look for
+
+        Returns:
+            bool: True if a node with the key is linked, False otherwise
+        """
+        return key in self._nodes
+
     def hook_logger(self, callback: Callable[[str], None]) -> None:
         """
         Attach the given callback to the chain to receive debug messages, if enabled.
@@ -64,6 +388,17 @@ class ChainHelper:
         """
         self._logger = callback
 
+    def hook_pipeline(self, pipeline: Optional[DebugPipeline]) -> None:
+        """
+        Send debug messages, if enabled, to the given DebugPipeline instead of the
+        logger callback. The chain only queues structured records, leaving
+        formatting and delivery to the pipeline's worker thread.
+
+        Args:
+            pipeline: DebugPipeline to queue records on, or None to use the logger callback again
+        """
+        self._pipeline = pipeline
+
     def is_event(self) -> bool:
         """
         Return whether chain is set up as an event-chain.
@@ -73,92 +408,853 @@ class ChainHelper:
         """
         return self._is_event
 
-    def link_node(self, node: NodeBase) -> 'ChainHelper':
+    def link_node(self, node: NodeBase, priority: int = 0) -> 'ChainHelper':
         """
         Register a NodeBase object with the chain. If chain is an event-chain,
-        this will overwrite any existing node. If node is invalid, link will fail.
+        this will overwrite any existing node. If node is invalid, or another
+        node with the same key is already linked, link will fail. Nodes with a
+        higher priority are traversed first, and nodes with equal priority are
+        traversed in link order.
 
         Args:
             node: NodeBase object to register with chain
+            priority: Traversal priority of the node, higher values run earlier
 
         Returns:
             ChainHelper: Self for method chaining
         """
         if not node.is_valid():
             if self._do_debug:
-                self.log(f"Attempted to add invalid node: {node}")
+                self._debug(DEBUG_INVALID_NODE, None, node)
 
             return self
 
-        if self._is_event:
+        with self._lock:
+            if self._is_event:
+                if self._do_debug:
+                    self._debug(DEBUG_EVENT_NODE, None, node)
+
+                self._nodes = {}
+                self._order = []
+                self._ranks = {}
+            elif node.get_key() in self._nodes:
+                if self._do_debug:
+                    self._debug(DEBUG_DUPLICATE_NODE, None, node)
+
+                return self
+            else:
+                if self._do_debug:
+                    self._debug(DEBUG_LINK_NODE, None, node)
+
+            rank = (-priority, self._sequence)
+            self._sequence += 1
+
+            self._nodes[node.get_key()] = node
+            self._ranks[node.get_key()] = rank
+            bisect.insort(self._order, rank + (node.get_key(),))
+            self._clear_routes()
+
+        return self
+
+    def replace_node(self, key: str, node: NodeBase) -> bool:
+        """
+        Swap the linked node with the given key for another node, keeping its
+        position and priority in the chain. Replacement fails if the new node is
+        invalid or its key belongs to another linked node.
+
+        Args:
+            key: Key of the linked node to replace
+            node: NodeBase object to put in its place
+
+        Returns:
+            bool: True if node was replaced, False otherwise
+        """
+        if not node.is_valid():
             if self._do_debug:
-                self.log(f"Setting event node: {node}")
+                self._debug(DEBUG_REPLACE_INVALID, None, node)
+
+            return False
+
+        new_key = node.get_key()
+
+        with self._lock:
+            if key not in self._nodes or (new_key != key and new_key in self._nodes):
+                if self._do_debug:
+                    self._debug(DEBUG_REPLACE_FAILED, key, node)
+
+                return False
 
-            self._nodes = [node]
-        else:
             if self._do_debug:
-                self.log(f"Linking new node: {node}")
+                self._debug(DEBUG_REPLACE_NODE, key, node)
 
-            self._nodes.append(node)
+            if new_key != key:
+                rank = self._ranks.pop(key)
+                del self._nodes[key]
+                self._ranks[new_key] = rank
+                self._order[bisect.bisect_left(self._order, rank + (key,))] = rank + (new_key,)
 
-        return self
+            self._nodes[new_key] = node
+            self._clear_routes()
+
+        return True
+
+    def unlink_node(self, key: str) -> bool:
+        """
+        Remove the linked node with the given key from the chain.
+
+        Args:
+            key: Key of the node to remove
+
+        Returns:
+            bool: True if node was removed, False if no node has the key
+        """
+        with self._lock:
+            node = self._nodes.pop(key, None)
 
-    def traverse(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+            if node is None:
+                if self._do_debug:
+                    self._debug(DEBUG_UNLINK_MISSING, key)
+
+                return False
+
+            if self._do_debug:
+                self._debug(DEBUG_UNLINK_NODE, None, node)
+
+            rank = self._ranks.pop(key)
+            del self._order[bisect.bisect_left(self._order, rank + (key,))]
+            self._clear_routes()
+
+        return True
+
+    async def atraverse(self, dispatch: DispatchBase, sender: Any = None, concurrent: bool = False) -> bool:
+        """
+        Coroutine version of traverse() that awaits AsyncNodeBase nodes and calls
+        other nodes directly. Consumable dispatches always visit nodes one at a
+        time so consumption still stops the traversal. Non-consumable dispatches
+        can optionally fan out, in which case synchronous nodes are called first,
+        in traversal order, and the async nodes are then awaited together. No
+        coroutine is created until every synchronous node has returned, and when
+        async nodes raise, all of them still run to completion before the first
+        exception, in traversal order, is raised.
+
+        Args:
+            dispatch: DispatchBase object to distribute to linked nodes
+            sender: Optional sender data to pass to linked nodes
+            concurrent: Toggle for awaiting async nodes concurrently on non-consumable dispatches
+
+        Returns:
+            bool: True if traversal was successful, False otherwise
+        """
+        if not self._can_traverse(dispatch):
+            return False
+
+        if sender is None:
+            sender = self
+
+        is_consumable = dispatch.is_consumable()
+        nodes = self._routes.get(dispatch.__class__)
+
+        if nodes is None:
+            nodes = self._async_routes.get(dispatch.__class__)
+
+            if nodes is None:
+                nodes = self._get_route(dispatch.__class__, True)
+
+        if not nodes:
+            if self._do_debug:
+                self._debug(DEBUG_UNHANDLED_DISPATCH, dispatch)
+        elif concurrent and not is_consumable:
+            pending = []
+
+            for node in nodes:
+                if self._do_debug:
+                    self._debug(DEBUG_SEND, dispatch, node)
+
+                if isinstance(node, AsyncNodeBase):
+                    pending.append(node)
+                else:
+                    node.process(sender, dispatch)
+
+            if pending:
+                results = await asyncio.gather(*(node.process(sender, dispatch) for node in pending),
+                                               return_exceptions=True)
+
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
+        else:
+            for node in nodes:
+                if self._do_debug:
+                    self._debug(DEBUG_SEND, dispatch, node)
+
+                if isinstance(node, AsyncNodeBase):
+                    await node.process(sender, dispatch)
+                else:
+                    node.process(sender, dispatch)
+
+                if is_consumable and dispatch.is_consumed():
+                    if self._do_debug:
+                        self._debug(DEBUG_CONSUMED_BY, dispatch, node)
+
+                    break
+
+        return True
+
+    def traverse(self, dispatch: DispatchBase, sender: Any = None, budget_ns: Optional[int] = None) -> bool:
         """
-        Trigger distribution of given dispatch to all linked nodes in chain.
-        Will return False if no nodes are linked, the dispatch is invalid,
-        or the dispatch is consumable and has already been consumed.
+        Trigger distribution of given dispatch to all linked nodes in chain that
+        handle its class, in traversal order. Will return False if no nodes are
+        linked, the dispatch is invalid, or the dispatch is consumable and has
+        already been consumed.
+
+        Given a budget, no further nodes are visited once it is exhausted and
+        False is returned; a node already running is not interrupted. Use
+        traverse_isolated() to find out which nodes were skipped.
 
         Args:
             dispatch: DispatchBase object to distribute to linked nodes
             sender: Optional sender data to pass to linked nodes
+            budget_ns: Optional time budget for the traversal, in nanoseconds
 
         Returns:
             bool: True if traversal was successful, False otherwise
+
+        Raises:
+            ValueError: If budget_ns is negative
         """
+        deadline = _get_deadline(budget_ns)
+
         if len(self._nodes) < 1:
             if self._do_debug:
-                self.log("Attempted to traverse chain with no nodes")
+                self._debug(DEBUG_NO_NODES)
 
             return False
 
         if not dispatch.is_valid():
             if self._do_debug:
-                self.log(f"Attempted to traverse chain with invalid dispatch: {dispatch}")
+                self._debug(DEBUG_INVALID_DISPATCH, dispatch)
 
             return False
 
-        if dispatch.is_consumable() and dispatch.is_consumed():
+        is_consumable = dispatch.is_consumable()
+
+        if is_consumable and dispatch.is_consumed():
             if self._do_debug:
-                self.log(f"Attempted to traverse chain with consumed dispatch: {dispatch}")
+                self._debug(DEBUG_CONSUMED_DISPATCH, dispatch)
 
             return False
 
         if sender is None:
             sender = self
 
-        is_consumable = dispatch.is_consumable()
+        if self._observers or (is_consumable and self._adaptive is not None) or dispatch.get_trace() is not None:
+            return self._traverse_observed(dispatch, sender, None, deadline)
+
+        nodes = self._routes.get(dispatch.__class__)
+
+        if nodes is None:
+            nodes = self._get_route(dispatch.__class__)
+
+        if not nodes:
+            if self._do_debug:
+                self._debug(DEBUG_UNHANDLED_DISPATCH, dispatch)
+        elif deadline is not None:
+            perf_counter_ns = time.perf_counter_ns
+
+            for index, node in enumerate(nodes):
+                if perf_counter_ns() >= deadline:
+                    self._skip_nodes(dispatch, nodes[index:], None)
+
+                    return False
+
+                if self._do_debug:
+                    self._debug(DEBUG_SEND_EVENT if self._is_event else DEBUG_SEND, dispatch, node)
 
-        if self._is_event:
+                node.process(sender, dispatch)
+
+                if is_consumable and dispatch.is_consumed():
+                    if self._do_debug:
+                        self._debug(DEBUG_CONSUMED_BY, dispatch, node)
+
+                    break
+        elif self._is_event:
             if self._do_debug:
-                self.log(f"Sending dispatch ({dispatch}) to event node: {self._nodes[0]}")
+                self._debug(DEBUG_SEND_EVENT, dispatch, nodes[0])
 
-            self._nodes[0].process(sender, dispatch)
+            nodes[0].process(sender, dispatch)
         else:
-            for i, node in enumerate(self._nodes):
+            for node in nodes:
                 if self._do_debug:
-                    self.log(f"Sending dispatch ({dispatch}) to node: {node}")
+                    self._debug(DEBUG_SEND, dispatch, node)
 
                 node.process(sender, dispatch)
 
                 if is_consumable and dispatch.is_consumed():
                     if self._do_debug:
-                        self.log(f"Dispatch ({dispatch}) consumed by node: {node}")
+                        self._debug(DEBUG_CONSUMED_BY, dispatch, node)
+
+                    break
+
+        return True
+
+    def traverse_parallel(self, dispatch: DispatchBase, sender: Any = None,
+                          budget_ns: Optional[int] = None) -> TraversalOutcome:
+        """
+        Trigger distribution of given dispatch like traverse(), submitting each
+        node to the executor set with set_executor() and waiting for all of them
+        to complete. Nodes marked as CPU-bound go to the executor set with
+        set_process_executor() instead, when there is one, and have their results
+        merged back in traversal order; without a thread executor, the remaining
+        nodes run inline, each after the results of earlier CPU-bound nodes are
+        merged. Only non-consumable dispatches are run concurrently; consumable
+        dispatches, and chains without executors, visit nodes one at a time. Node exceptions are recorded in the
+        outcome instead of raised, and in the serial case end the traversal as
+        they would with traverse().
+
+        Nodes run concurrently may call DispatchBase.set_result() from several
+        threads at once, so stateful dispatches can receive results out of traversal order.
+
+        Given a budget, nodes still pending on an executor when it is exhausted
+        are abandoned: their futures are cancelled if they haven't started, and
+        they are reported as skipped either way. An abandoned node that is already
+        running keeps running and may still modify the dispatch.
+
+        Args:
+            dispatch: DispatchBase object to distribute to linked nodes
+            sender: Optional sender data to pass to linked nodes
+            budget_ns: Optional time budget for the traversal, in nanoseconds
+
+        Returns:
+            TraversalOutcome: Per-node outcomes, good if traversal succeeded and no node raised or was skipped
+
+        Raises:
+            ValueError: If budget_ns is negative
+        """
+        deadline = _get_deadline(budget_ns)
+        ret = TraversalOutcome()
+
+        if not self._can_traverse(dispatch):
+            return ret
+
+        remote_sender = sender
+
+        if sender is None:
+            sender = self
+
+        is_consumable = dispatch.is_consumable()
+        nodes = self._routes.get(dispatch.__class__)
+
+        if nodes is None:
+            nodes = self._get_route(dispatch.__class__)
+
+        has_executor = self._executor is not None or self._process_executor is not None
+
+        if not has_executor or is_consumable or len(nodes) < 2:
+            for index, node in enumerate(nodes):
+                if deadline is not None and time.perf_counter_ns() >= deadline:
+                    self._skip_nodes(dispatch, nodes[index:], ret)
+
+                    break
+
+                if self._do_debug:
+                    self._debug(DEBUG_SEND, dispatch, node)
+
+                try:
+                    if self._process_executor is not None and node.is_cpu_bound():
+                        future = self._process_executor.submit(_process_remote, node, remote_sender, dispatch)
+
+                        try:
+                            remote = future.result(_get_timeout(deadline))
+                        except FutureTimeoutError:
+                            future.cancel()
+                            self._skip_nodes(dispatch, nodes[index:], ret)
+
+                            break
+
+                        _merge_remote(dispatch, remote)
+                    else:
+                        node.process(sender, dispatch)
+                except Exception as e:
+                    ret.add_error(node.get_key(), e)
+
+                    break
+
+                ret.add_visited(node.get_key())
+
+                if is_consumable and dispatch.is_consumed():
+                    if self._do_debug:
+                        self._debug(DEBUG_CONSUMED_BY, dispatch, node)
 
                     break
+        else:
+            entries = []
+
+            for node in nodes:
+                if self._do_debug:
+                    self._debug(DEBUG_SUBMIT, dispatch, node)
+
+                if self._process_executor is not None and node.is_cpu_bound():
+                    entries.append((node, self._process_executor.submit(
+                        _process_remote, node, remote_sender, dispatch), True))
+                elif self._executor is not None:
+                    entries.append((node, self._executor.submit(node.process, sender, dispatch), False))
+                else:
+                    entries.append((node, None, False))
+
+            errors: Dict[NodeBase, Exception] = {}
+            skipped: List[NodeBase] = []
+
+            for node, future, is_remote in entries:
+                if future is None:
+                    if deadline is not None and time.perf_counter_ns() >= deadline:
+                        skipped.append(node)
+
+                        continue
+
+                    try:
+                        node.process(sender, dispatch)
+                    except Exception as e:
+                        errors[node] = e
+                elif is_remote:
+                    if not wait([future], _get_timeout(deadline)).done:
+                        future.cancel()
+                        skipped.append(node)
+
+                        continue
+
+                    error = future.exception()
+
+                    if error is not None:
+                        errors[node] = error
+                    else:
+                        _merge_remote(dispatch, future.result())
+
+            futures = [future for _, future, is_remote in entries if future is not None and not is_remote]
+
+            if deadline is not None and futures:
+                wait(futures, _get_timeout(deadline))
+
+            for node, future, is_remote in entries:
+                if future is None or is_remote:
+                    continue
+
+                if deadline is not None and not future.done():
+                    future.cancel()
+                    skipped.append(node)
+
+                    continue
+
+                error = future.exception()
+
+                if error is not None:
+                    errors[node] = error
+
+            for node in nodes:
+                if node in errors:
+                    ret.add_error(node.get_key(), errors[node])
+                elif node not in skipped:
+                    ret.add_visited(node.get_key())
+
+            self._skip_nodes(dispatch, [node for node in nodes if node in skipped], ret)
+
+        if not ret.has_errors() and not ret.has_skipped():
+            ret.make_good()
+
+        return ret
+
+    def traverse_batch(self, dispatches: Iterable[DispatchBase], sender: Any = None) -> bytearray:
+        """
+        Trigger distribution of a batch of dispatches, visiting each node once
+        with NodeBase.process_batch() for all dispatches it handles, instead of
+        once per dispatch. Nodes still see dispatches in traversal order and a
+        consumed dispatch isn't passed to later nodes, but each node finishes the
+        whole batch before the next node starts.
+
+        Chains with debug messages, observers or adaptive ordering, and traced
+        dispatches, are traversed one dispatch at a time as with traverse_many().
+
+        Args:
+            dispatches: Iterable of DispatchBase objects to distribute
+            sender: Optional sender data to pass to linked nodes
+
+        Returns:
+            bytearray: One entry per dispatch, 1 if its traversal was successful, 0 otherwise
+        """
+        dispatches = list(dispatches)
+
+        if self._do_debug or self._observers or self._adaptive is not None or len(self._nodes) < 1:
+            return self.traverse_many(dispatches, sender)
+
+        if sender is None:
+            sender = self
+
+        ret = bytearray(len(dispatches))
+        pending = []
+
+        for index, dispatch in enumerate(dispatches):
+            if not dispatch.is_valid() or (dispatch.is_consumable() and dispatch.is_consumed()):
+                continue
+
+            if dispatch.get_trace() is not None:
+                ret[index] = self.traverse(dispatch, sender)
+            else:
+                ret[index] = 1
+                pending.append(dispatch)
+
+        if not pending:
+            return ret
+
+        dispatch_types = set(dispatch.__class__ for dispatch in pending)
+
+        for dispatch_type in dispatch_types:
+            if dispatch_type not in self._routes:
+                self._get_route(dispatch_type)
+
+        with self._lock:
+            nodes = self._get_ordered_nodes()
+
+        for node in nodes:
+            handled = [dispatch_type for dispatch_type in dispatch_types if node.handles_dispatch_type(dispatch_type)]
+
+            if len(handled) == len(dispatch_types):
+                batch = pending
+            else:
+                batch = [dispatch for dispatch in pending if dispatch.__class__ in handled]
+
+            if batch:
+                node.process_batch(sender, batch)
+
+            pending = [dispatch for dispatch in pending if not (dispatch.is_consumable() and dispatch.is_consumed())]
+
+            if not pending:
+                break
+
+        return ret
+
+    def traverse_isolated(self, dispatch: DispatchBase, sender: Any = None,
+                          budget_ns: Optional[int] = None) -> TraversalOutcome:
+        """
+        Trigger distribution of given dispatch like traverse(), but isolate nodes
+        from each other: an exception raised by a node is recorded in the outcome
+        and the traversal continues with the next node. Observers see the failed
+        call with OUTCOME_ERROR. Nodes not visited because the budget ran out are
+        recorded as skipped, and nodes whose circuit is open as bypassed.
+
+        Args:
+            dispatch: DispatchBase object to distribute to linked nodes
+            sender: Optional sender data to pass to linked nodes
+            budget_ns: Optional time budget for the traversal, in nanoseconds
+
+        Returns:
+            TraversalOutcome: Per-node outcomes, good if traversal succeeded and no node raised or was left out
+
+        Raises:
+            ValueError: If budget_ns is negative
+        """
+        deadline = _get_deadline(budget_ns)
+        ret = TraversalOutcome()
+
+        if not self._can_traverse(dispatch):
+            return ret
+
+        self._traverse_observed(dispatch, self if sender is None else sender, ret, deadline)
+
+        if not ret.has_errors() and not ret.has_skipped() and not ret.has_bypassed():
+            ret.make_good()
+
+        return ret
+
+    def traverse_many(self, dispatches: Iterable[DispatchBase], sender: Any = None) -> bytearray:
+        """
+        Trigger distribution of each given dispatch to the chain, with the same
+        semantics as traverse(). Dispatches are consumed lazily, so generators
+        are supported.
+
+        Args:
+            dispatches: Iterable of DispatchBase objects to distribute
+            sender: Optional sender data to pass to linked nodes
+
+        Returns:
+            bytearray: One entry per dispatch, 1 if its traversal was successful, 0 otherwise
+        """
+        if self._do_debug or self._observers or self._adaptive is not None or len(self._nodes) < 1:
+            traverse = self.traverse
+
+            return bytearray(traverse(dispatch, sender) for dispatch in dispatches)
+
+        if sender is None:
+            sender = self
+
+        ret = bytearray()
+        append = ret.append
+        routes = self._routes
+        get_route = self._get_route
+        traverse = self.traverse
+        is_event = self._is_event
+
+        for dispatch in dispatches:
+            if not dispatch.is_valid():
+                append(0)
+
+                continue
+
+            if dispatch.get_trace() is not None:
+                append(traverse(dispatch, sender))
+
+                continue
+
+            is_consumable = dispatch.is_consumable()
+
+            if is_consumable and dispatch.is_consumed():
+                append(0)
+
+                continue
+
+            nodes = routes.get(dispatch.__class__)
+
+            if nodes is None:
+                nodes = get_route(dispatch.__class__)
+
+            if is_event:
+                if nodes:
+                    nodes[0].process(sender, dispatch)
+            elif is_consumable:
+                for node in nodes:
+                    node.process(sender, dispatch)
+
+                    if dispatch.is_consumed():
+                        break
+            else:
+                for node in nodes:
+                    node.process(sender, dispatch)
+
+            append(1)
+
+        return ret
+
+    def _traverse_observed(self, dispatch: DispatchBase, sender: Any, outcome: Optional[TraversalOutcome] = None,
+                           deadline: Optional[int] = None) -> bool:
+        """
+        Distribute a dispatch while timing each node call for attached observers,
+        the dispatch's trace and, for consumable dispatches, adaptive ordering.
+        Given an outcome, node exceptions are recorded in it and the traversal
+        continues; otherwise the first exception is raised.
+
+        Args:
+            dispatch: DispatchBase object to distribute
+            sender: Sender data to pass to linked nodes
+            outcome: Optional TraversalOutcome to record visited, failed and skipped nodes in
+            deadline: Optional time.perf_counter_ns() value after which no further nodes are visited
+
+        Returns:
+            bool: False if the deadline passed before all nodes were visited, True otherwise
+        """
+        observers = self._observers
+        breaker = self._breaker
+        trace = dispatch.get_trace()
+        is_consumable = dispatch.is_consumable()
+        adaptive = self._adaptive if is_consumable and not self._is_event else None
+        dispatch_type = dispatch.__class__
+        nodes = self._adaptive_routes.get(dispatch_type) if adaptive is not None else None
+
+        if nodes is None:
+            nodes = self._routes.get(dispatch_type)
+
+            if nodes is None:
+                nodes = self._get_route(dispatch_type)
+
+        if not nodes and self._do_debug:
+            self._debug(DEBUG_UNHANDLED_DISPATCH, dispatch)
+
+        visited = 0
+        is_complete = True
+        traversal_start = time.perf_counter_ns()
+
+        for index, node in enumerate(nodes):
+            if deadline is not None and time.perf_counter_ns() >= deadline:
+                self._skip_nodes(dispatch, nodes[index:], outcome)
+                is_complete = False
+
+                break
+
+            if breaker is not None and not breaker.allow(node.get_key()):
+                if self._do_debug:
+                    self._debug(DEBUG_CIRCUIT_OPEN, dispatch, node)
+
+                if trace is not None:
+                    trace.record(TRACE_BYPASSED, node.get_key(), node.get_version(), time.perf_counter_ns())
+
+                if outcome is not None:
+                    outcome.add_bypassed(node.get_key())
+
+                continue
+
+            if self._do_debug:
+                self._debug(DEBUG_SEND_EVENT if self._is_event else DEBUG_SEND, dispatch, node)
+
+            error = None
+            start = time.perf_counter_ns()
+
+            try:
+                node.process(sender, dispatch)
+            except Exception as e:
+                error = e
+
+            end = time.perf_counter_ns()
+            visited += 1
+            is_consumed = is_consumable and dispatch.is_consumed()
+
+            if trace is not None:
+                trace.record(TRACE_NODE_ENTER, node.get_key(), node.get_version(), start)
+                trace.record(TRACE_NODE_EXIT, node.get_key(), node.get_version(), end)
+
+                if is_consumed:
+                    trace.record(TRACE_CONSUMED, node.get_key(), node.get_version(), end)
+
+            if error is not None:
+                for observer in observers:
+                    observer.on_node(node, dispatch, start, end, OUTCOME_ERROR)
+
+                if outcome is None:
+                    for observer in observers:
+                        observer.on_traversal(dispatch, traversal_start, end, visited)
+
+                    raise error
+
+                outcome.add_error(node.get_key(), error)
+            else:
+                for observer in observers:
+                    observer.on_node(node, dispatch, start, end, OUTCOME_CONSUMED if is_consumed else OUTCOME_PROCESSED)
+
+                if outcome is not None:
+                    outcome.add_visited(node.get_key())
+
+            if adaptive is not None:
+                adaptive.record(dispatch_type, node.get_key(), end - start, is_consumed)
+
+            if is_consumed:
+                if self._do_debug:
+                    self._debug(DEBUG_CONSUMED_BY, dispatch, node)
+
+                break
+
+        if observers:
+            traversal_end = time.perf_counter_ns()
+
+            for observer in observers:
+                observer.on_traversal(dispatch, traversal_start, traversal_end, visited)
+
+        if adaptive is not None and adaptive.tick(dispatch_type):
+            with self._lock:
+                route = self._routes.get(dispatch_type)
+
+                # A missing route means the nodes changed since this traversal started; reorder on a later tick
+                if route is not None:
+                    self._adaptive_routes[dispatch_type] = adaptive.reorder(
+                        dispatch_type, [(self._ranks.get(node.get_key(), (0,))[0], node) for node in route])
+
+        return is_complete
+
+    def _can_traverse(self, dispatch: DispatchBase) -> bool:
+        """
+        Return whether the chain has nodes and the given dispatch is valid and
+        not already consumed, logging the reason when it can't be traversed.
+
+        Args:
+            dispatch: DispatchBase object about to be distributed
+
+        Returns:
+            bool: True if dispatch can be distributed, False otherwise
+        """
+        if len(self._nodes) < 1:
+            if self._do_debug:
+                self._debug(DEBUG_NO_NODES)
+
+            return False
+
+        if not dispatch.is_valid():
+            if self._do_debug:
+                self._debug(DEBUG_INVALID_DISPATCH, dispatch)
+
+            return False
+
+        if dispatch.is_consumable() and dispatch.is_consumed():
+            if self._do_debug:
+                self._debug(DEBUG_CONSUMED_DISPATCH, dispatch)
+
+            return False
 
         return True
 
+    def _skip_nodes(self, dispatch: DispatchBase, nodes: List[NodeBase], outcome: Optional[TraversalOutcome]) -> None:
+        """
+        Report nodes left out of a traversal because its budget ran out.
+
+        Args:
+            dispatch: DispatchBase object being distributed
+            nodes: Nodes that did not process the dispatch
+            outcome: Optional TraversalOutcome to record the skipped nodes in
+        """
+        for node in nodes:
+            if self._do_debug:
+                self._debug(DEBUG_DEADLINE, dispatch, node)
+
+            if outcome is not None:
+                outcome.add_skipped(node.get_key())
+
+    def _clear_routes(self) -> None:
+        """
+        Drop cached routes after a change to the linked nodes.
+        """
+        self._routes = {}
+        self._async_routes = {}
+        self._adaptive_routes = {}
+
+    def _get_ordered_nodes(self) -> List[NodeBase]:
+        """
+        Return the linked nodes in traversal order.
+
+        Returns:
+            List[NodeBase]: Linked nodes sorted by priority, then link order
+        """
+        return [self._nodes[key] for _, _, key in self._order]
+
+    def _get_route(self, dispatch_type: Type[DispatchBase], allow_async: bool = False) -> List[NodeBase]:
+        """
+        Resolve and cache the linked nodes that handle the given dispatch class,
+        in traversal order. Routes are rebuilt after any change to the linked
+        nodes, so traversals already under way keep their own list. Node
+        declarations are matched against the class MRO, so a node declared for a
+        base class also receives its subclasses.
+
+        Routes containing AsyncNodeBase nodes are cached apart from the others,
+        so only atraverse() finds them; synchronous traversals get a TypeError.
+
+        Args:
+            dispatch_type: Concrete class of the dispatch being traversed
+            allow_async: Toggle for returning routes that contain async nodes
+
+        Returns:
+            List[NodeBase]: Linked nodes that handle the dispatch class
+
+        Raises:
+            TypeError: If the route contains an async node and allow_async is False
+        """
+        with self._lock:
+            route = [node for node in self._get_ordered_nodes() if node.handles_dispatch_type(dispatch_type)]
+            async_node = next((node for node in route if isinstance(node, AsyncNodeBase)), None)
+
+            if async_node is None:
+                self._routes[dispatch_type] = route
+            else:
+                self._async_routes[dispatch_type] = route
+
+        if async_node is not None and not allow_async:
+            raise TypeError(f"Dispatch {dispatch_type.__name__} is routed to async node '{async_node.get_key()}', "
+                            f"traverse it with atraverse()")
+
+        return route
+
     def log(self, message: str) -> None:
         """
         Conditionally send debug message to registered callback.
@@ -166,5 +1262,19 @@ class ChainHelper:
         Args:
             message: Message to send to callback
         """
-        if self._logger is not None:
-            self._logger(message)
\ No newline at end of file
+        self._debug(DEBUG_MESSAGE, message)
+
+    def _debug(self, code: int, subject: Any = None, node: Any = None) -> None:
+        """
+        Queue a debug record on the hooked pipeline, or format it and send it to
+        the registered callback.
+
+        Args:
+            code: One of the DEBUG_* constants
+            subject: Dispatch, node key or message the record is about
+            node: Node the record is about
+        """
+        if self._pipeline is not None:
+            self._pipeline.submit(code, subject, node)
+        elif self._logger is not None:
+            self._logger(format_debug_record(code, subject, node))
\ No newline at end of file
@@ -0,0 +1,125 @@
+import threading
+from .chain_observer import ChainObserver, OUTCOME_CONSUMED, OUTCOME_ERROR
+from .node_base import NodeBase
+from .dispatch_base import DispatchBase
+from typing import List, Any, Dict, Tuple
+
+# Number of power-of-two latency buckets, enough for any 64-bit duration
+NUM_BUCKETS = 64
+
+
+def _histogram_to_dict(buckets: List[int]) -> Dict[int, int]:
+    """
+    Convert a bucket list into a mapping of upper bound in nanoseconds to count,
+    leaving out empty buckets.
+
+    Args:
+        buckets: Counts indexed by bit length of the duration
+
+    Returns:
+        Dict[int, int]: Counts keyed by exclusive upper bound in nanoseconds
+    """
+    return {1 << i: count for i, count in enumerate(buckets) if count > 0}
+
+
+class ChainMetrics(ChainObserver):
+    """
+    Observer that counts node calls, consumptions and exceptions and keeps
+    power-of-two latency histograms for nodes and whole traversals.
+    """
+
+    def __init__(self):
+        """Initialize a new ChainMetrics instance."""
+        self._lock: threading.Lock = threading.Lock()
+        self._nodes: Dict[Tuple[str, str], List[Any]] = {}
+        self._traversals: int = 0
+        self._traversal_ns: int = 0
+        self._traversal_buckets: List[int] = [0] * NUM_BUCKETS
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the collected metrics. Nodes are tracked by key and
+        version, so a node replaced by an identical one is reported together with it.
+
+        Returns:
+            Dict[str, Any]: Traversal totals and per-node counters and histograms
+        """
+        with self._lock:
+            nodes = [(key, stats[:4] + [list(stats[4])]) for key, stats in self._nodes.items()]
+            ret = {
+                'traversals': {
+                    'count': self._traversals,
+                    'total_ns': self._traversal_ns,
+                    'histogram': _histogram_to_dict(self._traversal_buckets)
+                },
+                'nodes': []
+            }
+
+        for (key, version), (calls, consumes, errors, total_ns, buckets) in nodes:
+            ret['nodes'].append({
+                'key': key,
+                'version': version,
+                'calls': calls,
+                'consumes': consumes,
+                'exceptions': errors,
+                'total_ns': total_ns,
+                'histogram': _histogram_to_dict(buckets)
+            })
+
+        return ret
+
+    def on_node(self, node: NodeBase, dispatch: DispatchBase, start_ns: int, end_ns: int, outcome: int) -> None:
+        """
+        Count a node call and add its latency to the node histogram.
+
+        Args:
+            node: Node that processed the dispatch
+            dispatch: Dispatch that was processed
+            start_ns: Timestamp taken before calling the node
+            end_ns: Timestamp taken after the node returned or raised
+            outcome: One of the OUTCOME_* constants
+        """
+        elapsed = end_ns - start_ns
+        key = (node.get_key(), node.get_version())
+
+        with self._lock:
+            stats = self._nodes.get(key)
+
+            if stats is None:
+                stats = self._nodes[key] = [0, 0, 0, 0, [0] * NUM_BUCKETS]
+
+            stats[0] += 1
+            stats[3] += elapsed
+            stats[4][elapsed.bit_length()] += 1
+
+            if outcome == OUTCOME_CONSUMED:
+                stats[1] += 1
+            elif outcome == OUTCOME_ERROR:
+                stats[2] += 1
+
+    def on_traversal(self, dispatch: DispatchBase, start_ns: int, end_ns: int, visited: int) -> None:
+        """
+        Count a traversal and add its latency to the traversal histogram.
+
+        Args:
+            dispatch: Dispatch that was traversed
+            start_ns: Timestamp taken before visiting the first node
+            end_ns: Timestamp taken after visiting the last node
+            visited: Number of nodes that were called
+        """
+        elapsed = end_ns - start_ns
+
+        with self._lock:
+            self._traversals += 1
+            self._traversal_ns += elapsed
+            self._traversal_buckets[elapsed.bit_length()] += 1
+
+    def reset(self) -> None:
+        """
+        Discard all collected metrics.
+        """
+        with self._lock:
+            self._nodes = {}
+            self._traversals = 0
+            self._traversal_ns = 0
+            self._traversal_buckets = [0] * NUM_BUCKETS
\ No newline at end of file
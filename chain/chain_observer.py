@@ -0,0 +1,47 @@
+from .node_base import NodeBase
+from .dispatch_base import DispatchBase
+
+# Node outcome constants
+OUTCOME_PROCESSED = 0
+OUTCOME_CONSUMED = 1
+OUTCOME_ERROR = 2
+
+# Readable names for each node outcome
+OUTCOME_NAMES = {
+    OUTCOME_PROCESSED: 'processed',
+    OUTCOME_CONSUMED: 'consumed',
+    OUTCOME_ERROR: 'error'
+}
+
+
+class ChainObserver:
+    """
+    Base class for objects attached to a ChainHelper to observe its traversals.
+    Both callbacks do nothing by default, so subclasses only override what they
+    need. Timestamps come from time.perf_counter_ns().
+    """
+
+    def on_node(self, node: NodeBase, dispatch: DispatchBase, start_ns: int, end_ns: int, outcome: int) -> None:
+        """
+        Called after a node has processed a dispatch, or raised while doing so.
+
+        Args:
+            node: Node that processed the dispatch
+            dispatch: Dispatch that was processed
+            start_ns: Timestamp taken before calling the node
+            end_ns: Timestamp taken after the node returned or raised
+            outcome: One of the OUTCOME_* constants
+        """
+        pass
+
+    def on_traversal(self, dispatch: DispatchBase, start_ns: int, end_ns: int, visited: int) -> None:
+        """
+        Called once a traversal has finished, including when a node raised.
+
+        Args:
+            dispatch: Dispatch that was traversed
+            start_ns: Timestamp taken before visiting the first node
+            end_ns: Timestamp taken after visiting the last node
+            visited: Number of nodes that were called
+        """
+        pass
\ No newline at end of file
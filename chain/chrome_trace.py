@@ -0,0 +1,208 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from .chain_observer import ChainObserver, OUTCOME_NAMES
+from .node_base import NodeBase
+from .dispatch_base import DispatchBase
+from typing import Any, Deque, Dict, Optional, TextIO, Tuple
+
+# Number of events formatted between yields to traversing threads
+WRITE_CHUNK = 64
+
+
+class ChromeTraceRecorder(ChainObserver):
+    """
+    Observer that writes traversals as Chrome trace-event JSON, viewable in
+    chrome://tracing or Perfetto. Each traversal is a duration slice named after
+    the dispatch class, with one nested slice per node call, on the thread that
+    ran it. Traversals only queue events as tuples; a background thread formats
+    and writes them once the buffer fills or the interval passes, and on flush()
+    or close(). Events observed after close() are ignored, so a finished trace
+    file is never overwritten.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 10000, interval: float = 0.5):
+        """
+        Create a new instance of ChromeTraceRecorder class and start its writer
+        thread. The file is created on the first flush.
+
+        Args:
+            path: Path of the trace file to write
+            buffer_size: Number of queued events that wakes the writer early
+            interval: Seconds the writer waits between writing out queued events
+        """
+        self._path: str = path
+        self._buffer_size: int = buffer_size
+        self._interval: float = interval
+        self._queue: Deque[Tuple[Any, ...]] = deque()
+        self._lock: threading.Lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._has_events: bool = False
+        self._is_closed: bool = False
+        self._pid: int = os.getpid()
+        self._threads: Dict[int, str] = {}
+        self._named_threads: set = set()
+        self._wake: threading.Event = threading.Event()
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(target=self._run, name='ChromeTraceRecorder', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'ChromeTraceRecorder':
+        """Return self so the recorder can be used as a context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the recorder when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the writer thread, write any queued events and terminate the JSON array.
+        """
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+
+        with self._lock:
+            self._is_closed = True
+
+            if self._file is not None:
+                self._file.write("\n]\n")
+                self._file.close()
+                self._file = None
+
+    def flush(self) -> None:
+        """
+        Format and write all queued events, a chunk at a time so traversing
+        threads get the interpreter back in between.
+        """
+        with self._lock:
+            if self._is_closed:
+                return
+
+            if self._file is None:
+                self._file = open(self._path, 'w')
+                self._file.write("[\n")
+
+            events = []
+
+            for tid, name in list(self._threads.items()):
+                if tid not in self._named_threads:
+                    self._named_threads.add(tid)
+                    events.append({'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid,
+                                   'args': {'name': name}})
+
+            remaining = len(self._queue)
+
+            while True:
+                while remaining > 0 and len(events) < WRITE_CHUNK:
+                    events.append(self._format(self._queue.popleft()))
+                    remaining -= 1
+
+                if events:
+                    if self._has_events:
+                        self._file.write(",\n")
+
+                    self._file.write(",\n".join(json.dumps(event) for event in events))
+                    self._has_events = True
+                    events = []
+
+                if remaining <= 0:
+                    break
+
+                time.sleep(0)
+
+            self._file.flush()
+
+    def on_node(self, node: NodeBase, dispatch: DispatchBase, start_ns: int, end_ns: int, outcome: int) -> None:
+        """
+        Buffer a slice for a node call.
+
+        Args:
+            node: Node that processed the dispatch
+            dispatch: Dispatch that was processed
+            start_ns: Timestamp taken before calling the node
+            end_ns: Timestamp taken after the node returned or raised
+            outcome: One of the OUTCOME_* constants
+        """
+        if self._is_closed:
+            return
+
+        self._queue.append((True, node.get_key(), node.get_version(), dispatch.__class__.__name__,
+                            start_ns, end_ns, self._get_tid(), outcome))
+
+        if len(self._queue) == self._buffer_size:
+            self._wake.set()
+
+    def on_traversal(self, dispatch: DispatchBase, start_ns: int, end_ns: int, visited: int) -> None:
+        """
+        Buffer the enclosing slice for a traversal.
+
+        Args:
+            dispatch: Dispatch that was traversed
+            start_ns: Timestamp taken before visiting the first node
+            end_ns: Timestamp taken after visiting the last node
+            visited: Number of nodes that were called
+        """
+        if self._is_closed:
+            return
+
+        self._queue.append((False, dispatch.__class__.__name__, None, None,
+                            start_ns, end_ns, self._get_tid(), visited))
+
+        if len(self._queue) == self._buffer_size:
+            self._wake.set()
+
+    def _format(self, entry: Tuple[Any, ...]) -> Dict[str, Any]:
+        """
+        Turn a buffered tuple into a trace event.
+
+        Args:
+            entry: Tuple buffered by on_node() or on_traversal()
+
+        Returns:
+            Dict[str, Any]: Complete ('X') trace event
+        """
+        is_node, name, version, dispatch_name, start_ns, end_ns, tid, extra = entry
+        event = {
+            'name': name,
+            'cat': 'node' if is_node else 'traversal',
+            'ph': 'X',
+            'ts': start_ns / 1000.0,
+            'dur': (end_ns - start_ns) / 1000.0,
+            'pid': self._pid,
+            'tid': tid
+        }
+
+        if is_node:
+            event['args'] = {'version': version, 'dispatch': dispatch_name, 'outcome': OUTCOME_NAMES.get(extra, extra)}
+        else:
+            event['args'] = {'visited': extra}
+
+        return event
+
+    def _run(self) -> None:
+        """
+        Writer loop that writes out queued events until stopped.
+        """
+        while not self._stop.is_set():
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            self.flush()
+
+    def _get_tid(self) -> int:
+        """
+        Return the native id of the calling thread, remembering its name.
+
+        Returns:
+            int: Native thread id
+        """
+        tid = threading.get_native_id()
+
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+
+        return tid
\ No newline at end of file
@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import deque
+from .chain_observer import ChainObserver, OUTCOME_ERROR
+from .node_base import NodeBase
+from .dispatch_base import DispatchBase
+from typing import Any, Deque, Dict, List, Optional
+
+# Circuit state constants
+CIRCUIT_CLOSED = 0
+CIRCUIT_OPEN = 1
+CIRCUIT_HALF_OPEN = 2
+
+# Readable names for each circuit state
+CIRCUIT_NAMES = {
+    CIRCUIT_CLOSED: 'closed',
+    CIRCUIT_OPEN: 'open',
+    CIRCUIT_HALF_OPEN: 'half-open'
+}
+
+
+class CircuitBreaker(ChainObserver):
+    """
+    Observer that tracks the outcome of the most recent calls to each node key
+    and opens that node's circuit when too many of them failed, by raising or
+    by taking longer than the slow threshold. A chain with the breaker set
+    bypasses nodes whose circuit is open. Once the cooldown has passed a single
+    probe call is let through: the circuit closes again if it succeeds, and
+    reopens for another cooldown if it fails.
+
+    Bypassed nodes don't see the dispatch at all, so a consumable dispatch can
+    travel further down the chain than it otherwise would.
+    """
+
+    def __init__(self, window: int = 20, failure_rate: float = 0.5, min_calls: int = 10,
+                 cooldown_ns: int = 5_000_000_000, slow_ns: Optional[int] = None):
+        """
+        Create a new instance of CircuitBreaker class. Normally set on a chain
+        with ChainHelper.set_circuit_breaker().
+
+        Args:
+            window: Number of most recent calls per node key to compute the failure rate over
+            failure_rate: Fraction of failed calls in the window at which the circuit opens
+            min_calls: Number of calls in the window before the circuit may open
+            cooldown_ns: Time an open circuit waits before letting a probe call through
+            slow_ns: Optional call duration above which a call counts as failed
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if window < 1:
+            raise ValueError("Window to CircuitBreaker() must be a positive integer")
+
+        if not 0 < failure_rate <= 1:
+            raise ValueError("Failure rate to CircuitBreaker() must be above 0 and at most 1")
+
+        if not 1 <= min_calls <= window:
+            raise ValueError("Minimum calls to CircuitBreaker() must be between 1 and the window")
+
+        if cooldown_ns < 0 or (slow_ns is not None and slow_ns < 0):
+            raise ValueError("Durations to CircuitBreaker() must not be negative")
+
+        self._window: int = window
+        self._failure_rate: float = failure_rate
+        self._min_calls: int = min_calls
+        self._cooldown_ns: int = cooldown_ns
+        self._slow_ns: Optional[int] = slow_ns
+        self._lock: threading.Lock = threading.Lock()
+        # Per node key: [state, opened_ns, is_probing, recent failures]
+        self._circuits: Dict[str, List[Any]] = {}
+
+    def allow(self, key: str) -> bool:
+        """
+        Return whether the node with the given key may be called. An open circuit
+        whose cooldown has passed turns half-open and allows one probe call.
+
+        Args:
+            key: Key of the node about to be called
+
+        Returns:
+            bool: True if the node may be called, False if it should be bypassed
+        """
+        circuit = self._circuits.get(key)
+
+        if circuit is None or circuit[0] == CIRCUIT_CLOSED:
+            return True
+
+        with self._lock:
+            if circuit[0] == CIRCUIT_CLOSED:
+                return True
+
+            if circuit[2] or time.perf_counter_ns() - circuit[1] < self._cooldown_ns:
+                return False
+
+            circuit[0] = CIRCUIT_HALF_OPEN
+            circuit[2] = True
+
+        return True
+
+    def get_state(self, key: str) -> int:
+        """
+        Return the circuit state of the node with the given key.
+
+        Args:
+            key: Key of the node
+
+        Returns:
+            int: One of the CIRCUIT_* constants
+        """
+        circuit = self._circuits.get(key)
+
+        return circuit[0] if circuit is not None else CIRCUIT_CLOSED
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the circuit of every node key that has been called.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: State name, calls and failures in the window, by node key
+        """
+        with self._lock:
+            return {key: {'state': CIRCUIT_NAMES[circuit[0]],
+                          'calls': len(circuit[3]),
+                          'failures': sum(circuit[3])}
+                    for key, circuit in self._circuits.items()}
+
+    def on_node(self, node: NodeBase, dispatch: DispatchBase, start_ns: int, end_ns: int, outcome: int) -> None:
+        """
+        Record the outcome of a node call and update the node's circuit.
+
+        Args:
+            node: Node that processed the dispatch
+            dispatch: Dispatch that was processed
+            start_ns: Timestamp taken before calling the node
+            end_ns: Timestamp taken after the node returned or raised
+            outcome: One of the OUTCOME_* constants
+        """
+        is_failure = outcome == OUTCOME_ERROR or (self._slow_ns is not None and end_ns - start_ns > self._slow_ns)
+        key = node.get_key()
+
+        with self._lock:
+            circuit = self._circuits.get(key)
+
+            if circuit is None:
+                circuit = self._circuits[key] = [CIRCUIT_CLOSED, 0, False, deque(maxlen=self._window)]
+
+            recent: Deque[bool] = circuit[3]
+
+            if circuit[0] == CIRCUIT_HALF_OPEN:
+                circuit[2] = False
+
+                if is_failure:
+                    circuit[0] = CIRCUIT_OPEN
+                    circuit[1] = end_ns
+                else:
+                    circuit[0] = CIRCUIT_CLOSED
+                    recent.clear()
+            elif circuit[0] == CIRCUIT_CLOSED:
+                recent.append(is_failure)
+
+                if len(recent) >= self._min_calls and sum(recent) >= self._failure_rate * len(recent):
+                    circuit[0] = CIRCUIT_OPEN
+                    circuit[1] = end_ns
+                    recent.clear()
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """
+        Close and forget the circuit of the node with the given key, or of all nodes.
+
+        Args:
+            key: Optional key of the node to reset
+        """
+        with self._lock:
+            if key is None:
+                self._circuits = {}
+            else:
+                self._circuits.pop(key, None)
\ No newline at end of file
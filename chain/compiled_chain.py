@@ -0,0 +1,363 @@
+import time
+from .chain_observer import ChainObserver, OUTCOME_PROCESSED, OUTCOME_CONSUMED, OUTCOME_ERROR
+from .circuit_breaker import CircuitBreaker
+from .node_base import NodeBase
+from .async_node_base import AsyncNodeBase
+from .dispatch_base import DispatchBase
+from .dispatch_trace import TRACE_NODE_ENTER, TRACE_NODE_EXIT, TRACE_CONSUMED, TRACE_BYPASSED
+from .debug_pipeline import (DebugPipeline, format_debug_record, DEBUG_MESSAGE, DEBUG_NO_NODES, DEBUG_INVALID_DISPATCH,
+                             DEBUG_CONSUMED_DISPATCH, DEBUG_UNHANDLED_DISPATCH, DEBUG_SEND, DEBUG_SEND_EVENT,
+                             DEBUG_CONSUMED_BY, DEBUG_CIRCUIT_OPEN)
+from typing import Tuple, Any, Optional, Dict, Callable, Iterable, Type
+
+
+class CompiledChain:
+    """
+    Immutable snapshot of a ChainHelper's nodes with a traversal plan chosen once
+    at construction, for chains that are configured up front and traversed often.
+    """
+
+    def __init__(self, nodes: Iterable[NodeBase], is_event: bool = False, do_debug: bool = False,
+                 logger: Optional[Callable[[str], None]] = None, pipeline: Optional[DebugPipeline] = None,
+                 observers: Iterable[ChainObserver] = (), breaker: Optional[CircuitBreaker] = None):
+        """
+        Create a new instance of CompiledChain class. Normally created through
+        ChainHelper.freeze() rather than directly.
+
+        Args:
+            nodes: Nodes to snapshot, in traversal order
+            is_event: Toggle for event-chain
+            do_debug: Toggle for sending debug messages
+            logger: Optional callback that receives debug messages
+            pipeline: Optional DebugPipeline that receives debug records instead of the logger
+            observers: Observers told about every node visit and traversal
+            breaker: Optional CircuitBreaker consulted before calling each node
+
+        Raises:
+            TypeError: If any node is an AsyncNodeBase.
+        """
+        self._nodes: Tuple[NodeBase, ...] = tuple(nodes)
+
+        for node in self._nodes:
+            if isinstance(node, AsyncNodeBase):
+                raise TypeError(f"Attempted to compile async node '{node.get_key()}', traverse it with atraverse()")
+
+        self._is_event: bool = is_event
+        self._do_debug: bool = do_debug
+        self._logger: Optional[Callable[[str], None]] = logger
+        self._pipeline: Optional[DebugPipeline] = pipeline
+        self._observers: Tuple[ChainObserver, ...] = tuple(observers)
+        self._breaker: Optional[CircuitBreaker] = breaker
+        self._routes: Dict[Type[DispatchBase], Tuple[NodeBase, ...]] = {}
+        self._is_routed: bool = any(node.get_dispatch_types() for node in self._nodes)
+        self.traverse: Callable[[DispatchBase, Any], bool] = self._select_plan()
+
+    def get_node_list(self) -> Tuple[Dict[str, str], ...]:
+        """
+        Return the full list of nodes in the snapshot.
+
+        Returns:
+            Tuple[Dict[str, str], ...]: Node information
+        """
+        return tuple({'key': node.get_key(), 'version': node.get_version()} for node in self._nodes)
+
+    def is_event(self) -> bool:
+        """
+        Return whether snapshot was taken from an event-chain.
+
+        Returns:
+            bool: True if chain is an event-chain, False otherwise
+        """
+        return self._is_event
+
+    def traverse(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+        """
+        Trigger distribution of given dispatch to the snapshot's nodes, with the
+        same semantics as ChainHelper.traverse(). Replaced on each instance by the
+        specialized plan picked in the constructor.
+
+        Args:
+            dispatch: DispatchBase object to distribute to nodes
+            sender: Optional sender data to pass to nodes
+
+        Returns:
+            bool: True if traversal was successful, False otherwise
+        """
+        return self._select_plan()(dispatch, sender)
+
+    def _select_plan(self) -> Callable[[DispatchBase, Any], bool]:
+        """
+        Pick the specialized traversal function for this snapshot.
+
+        Returns:
+            Callable[[DispatchBase, Any], bool]: Traversal function
+        """
+        if self._observers or self._breaker is not None:
+            return self._traverse_observed
+
+        if self._do_debug:
+            return self._traverse_debug
+
+        if len(self._nodes) < 1:
+            return self._traverse_empty
+
+        if self._is_routed:
+            return self._traverse_routed
+
+        if len(self._nodes) == 1:
+            return self._traverse_single
+
+        return self._traverse_unrouted
+
+    def _get_route(self, dispatch_type: Type[DispatchBase]) -> Tuple[NodeBase, ...]:
+        """
+        Resolve and cache the snapshot nodes that handle the given dispatch class.
+
+        Args:
+            dispatch_type: Concrete class of the dispatch being traversed
+
+        Returns:
+            Tuple[NodeBase, ...]: Nodes that handle the dispatch class
+        """
+        route = tuple(node for node in self._nodes if node.handles_dispatch_type(dispatch_type))
+        self._routes[dispatch_type] = route
+
+        return route
+
+    def _traverse_empty(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+        """Plan for snapshots without nodes."""
+        return False
+
+    def _traverse_single(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+        """Plan for event-chains and single-node snapshots without declared dispatch types."""
+        if dispatch.get_trace() is not None:
+            return self._traverse_observed(dispatch, sender)
+
+        if not dispatch.is_valid() or (dispatch.is_consumable() and dispatch.is_consumed()):
+            return False
+
+        self._nodes[0].process(self if sender is None else sender, dispatch)
+
+        return True
+
+    def _traverse_unrouted(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+        """Plan for multi-node snapshots without declared dispatch types."""
+        if dispatch.get_trace() is not None:
+            return self._traverse_observed(dispatch, sender)
+
+        if not dispatch.is_valid():
+            return False
+
+        if sender is None:
+            sender = self
+
+        if dispatch.is_consumable():
+            if dispatch.is_consumed():
+                return False
+
+            for node in self._nodes:
+                node.process(sender, dispatch)
+
+                if dispatch.is_consumed():
+                    break
+        else:
+            for node in self._nodes:
+                node.process(sender, dispatch)
+
+        return True
+
+    def _traverse_routed(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+        """Plan for snapshots where at least one node declared dispatch types."""
+        if dispatch.get_trace() is not None:
+            return self._traverse_observed(dispatch, sender)
+
+        if not dispatch.is_valid():
+            return False
+
+        if sender is None:
+            sender = self
+
+        nodes = self._routes.get(dispatch.__class__)
+
+        if nodes is None:
+            nodes = self._get_route(dispatch.__class__)
+
+        if dispatch.is_consumable():
+            if dispatch.is_consumed():
+                return False
+
+            for node in nodes:
+                node.process(sender, dispatch)
+
+                if dispatch.is_consumed():
+                    break
+        else:
+            for node in nodes:
+                node.process(sender, dispatch)
+
+        return True
+
+    def _traverse_debug(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+        """Plan for snapshots with debug messages enabled."""
+        if dispatch.get_trace() is not None:
+            return self._traverse_observed(dispatch, sender)
+
+        if len(self._nodes) < 1:
+            self._debug(DEBUG_NO_NODES)
+
+            return False
+
+        if not dispatch.is_valid():
+            self._debug(DEBUG_INVALID_DISPATCH, dispatch)
+
+            return False
+
+        if dispatch.is_consumable() and dispatch.is_consumed():
+            self._debug(DEBUG_CONSUMED_DISPATCH, dispatch)
+
+            return False
+
+        if sender is None:
+            sender = self
+
+        is_consumable = dispatch.is_consumable()
+        nodes = self._routes.get(dispatch.__class__)
+
+        if nodes is None:
+            nodes = self._get_route(dispatch.__class__)
+
+        if not nodes:
+            self._debug(DEBUG_UNHANDLED_DISPATCH, dispatch)
+
+        for node in nodes:
+            self._debug(DEBUG_SEND_EVENT if self._is_event else DEBUG_SEND, dispatch, node)
+
+            node.process(sender, dispatch)
+
+            if is_consumable and dispatch.is_consumed():
+                self._debug(DEBUG_CONSUMED_BY, dispatch, node)
+
+                break
+
+        return True
+
+    def _traverse_observed(self, dispatch: DispatchBase, sender: Any = None) -> bool:
+        """Plan for snapshots with observers or a circuit breaker, and for traced dispatches."""
+        if len(self._nodes) < 1:
+            if self._do_debug:
+                self._debug(DEBUG_NO_NODES)
+
+            return False
+
+        if not dispatch.is_valid():
+            if self._do_debug:
+                self._debug(DEBUG_INVALID_DISPATCH, dispatch)
+
+            return False
+
+        is_consumable = dispatch.is_consumable()
+
+        if is_consumable and dispatch.is_consumed():
+            if self._do_debug:
+                self._debug(DEBUG_CONSUMED_DISPATCH, dispatch)
+
+            return False
+
+        if sender is None:
+            sender = self
+
+        observers = self._observers
+        breaker = self._breaker
+        trace = dispatch.get_trace()
+        nodes = self._routes.get(dispatch.__class__)
+
+        if nodes is None:
+            nodes = self._get_route(dispatch.__class__)
+
+        if not nodes and self._do_debug:
+            self._debug(DEBUG_UNHANDLED_DISPATCH, dispatch)
+
+        visited = 0
+        traversal_start = time.perf_counter_ns()
+
+        for node in nodes:
+            if breaker is not None and not breaker.allow(node.get_key()):
+                if self._do_debug:
+                    self._debug(DEBUG_CIRCUIT_OPEN, dispatch, node)
+
+                if trace is not None:
+                    trace.record(TRACE_BYPASSED, node.get_key(), node.get_version(), time.perf_counter_ns())
+
+                continue
+
+            if self._do_debug:
+                self._debug(DEBUG_SEND_EVENT if self._is_event else DEBUG_SEND, dispatch, node)
+
+            error = None
+            start = time.perf_counter_ns()
+
+            try:
+                node.process(sender, dispatch)
+            except Exception as e:
+                error = e
+
+            end = time.perf_counter_ns()
+            visited += 1
+            is_consumed = is_consumable and dispatch.is_consumed()
+
+            if trace is not None:
+                trace.record(TRACE_NODE_ENTER, node.get_key(), node.get_version(), start)
+                trace.record(TRACE_NODE_EXIT, node.get_key(), node.get_version(), end)
+
+                if is_consumed:
+                    trace.record(TRACE_CONSUMED, node.get_key(), node.get_version(), end)
+
+            if error is not None:
+                for observer in observers:
+                    observer.on_node(node, dispatch, start, end, OUTCOME_ERROR)
+
+                for observer in observers:
+                    observer.on_traversal(dispatch, traversal_start, end, visited)
+
+                raise error
+
+            for observer in observers:
+                observer.on_node(node, dispatch, start, end, OUTCOME_CONSUMED if is_consumed else OUTCOME_PROCESSED)
+
+            if is_consumed:
+                if self._do_debug:
+                    self._debug(DEBUG_CONSUMED_BY, dispatch, node)
+
+                break
+
+        if observers:
+            traversal_end = time.perf_counter_ns()
+
+            for observer in observers:
+                observer.on_traversal(dispatch, traversal_start, traversal_end, visited)
+
+        return True
+
+    def log(self, message: str) -> None:
+        """
+        Conditionally send debug message to registered callback.
+
+        Args:
+            message: Message to send to callback
+        """
+        self._debug(DEBUG_MESSAGE, message)
+
+    def _debug(self, code: int, subject: Any = None, node: Any = None) -> None:
+        """
+        Queue a debug record on the pipeline, or format it and send it to the
+        registered callback.
+
+        Args:
+            code: One of the DEBUG_* constants
+            subject: Dispatch, node key or message the record is about
+            node: Node the record is about
+        """
+        if self._pipeline is not None:
+            self._pipeline.submit(code, subject, node)
+        elif self._logger is not None:
+            self._logger(format_debug_record(code, subject, node))
\ No newline at end of file
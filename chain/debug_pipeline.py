@@ -0,0 +1,213 @@
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Type
+
+# Debug record codes
+DEBUG_MESSAGE = 0
+DEBUG_NO_NODES = 1
+DEBUG_INVALID_DISPATCH = 2
+DEBUG_CONSUMED_DISPATCH = 3
+DEBUG_UNHANDLED_DISPATCH = 4
+DEBUG_SEND = 5
+DEBUG_SEND_EVENT = 6
+DEBUG_SUBMIT = 7
+DEBUG_CONSUMED_BY = 8
+DEBUG_INVALID_NODE = 9
+DEBUG_EVENT_NODE = 10
+DEBUG_DUPLICATE_NODE = 11
+DEBUG_LINK_NODE = 12
+DEBUG_REPLACE_INVALID = 13
+DEBUG_REPLACE_FAILED = 14
+DEBUG_REPLACE_NODE = 15
+DEBUG_UNLINK_MISSING = 16
+DEBUG_UNLINK_NODE = 17
+DEBUG_DEADLINE = 18
+DEBUG_CIRCUIT_OPEN = 19
+
+# Message templates by code, formatted with the record subject and node
+DEBUG_MESSAGES = {
+    DEBUG_MESSAGE: "{0}",
+    DEBUG_NO_NODES: "Attempted to traverse chain with no nodes",
+    DEBUG_INVALID_DISPATCH: "Attempted to traverse chain with invalid dispatch: {0}",
+    DEBUG_CONSUMED_DISPATCH: "Attempted to traverse chain with consumed dispatch: {0}",
+    DEBUG_UNHANDLED_DISPATCH: "No linked nodes handle dispatch: {0}",
+    DEBUG_SEND: "Sending dispatch ({0}) to node: {1}",
+    DEBUG_SEND_EVENT: "Sending dispatch ({0}) to event node: {1}",
+    DEBUG_SUBMIT: "Submitting dispatch ({0}) to node: {1}",
+    DEBUG_CONSUMED_BY: "Dispatch ({0}) consumed by node: {1}",
+    DEBUG_INVALID_NODE: "Attempted to add invalid node: {1}",
+    DEBUG_EVENT_NODE: "Setting event node: {1}",
+    DEBUG_DUPLICATE_NODE: "Attempted to add node with duplicate key: {1}",
+    DEBUG_LINK_NODE: "Linking new node: {1}",
+    DEBUG_REPLACE_INVALID: "Attempted to replace with invalid node: {1}",
+    DEBUG_REPLACE_FAILED: "Attempted to replace node '{0}' with: {1}",
+    DEBUG_REPLACE_NODE: "Replacing node '{0}' with: {1}",
+    DEBUG_UNLINK_MISSING: "Attempted to unlink missing node: {0}",
+    DEBUG_UNLINK_NODE: "Unlinking node: {1}",
+    DEBUG_DEADLINE: "Traversal budget for dispatch ({0}) exhausted, skipping node: {1}",
+    DEBUG_CIRCUIT_OPEN: "Circuit open, bypassing node: {1}"
+}
+
+
+def format_debug_record(code: int, subject: Any = None, node: Any = None) -> str:
+    """
+    Format a debug record into the message sent to logger callbacks.
+
+    Args:
+        code: One of the DEBUG_* constants
+        subject: Dispatch, node key or message the record is about
+        node: Node the record is about
+
+    Returns:
+        str: Formatted message
+    """
+    return DEBUG_MESSAGES[code].format(subject, node)
+
+
+class DebugPipeline:
+    """
+    Class to deliver chain debug messages from a background thread. Chains push
+    structured records onto a bounded queue without formatting them; the worker
+    thread formats and hands them to the callback. Records are dropped, and
+    counted, when the queue is full, and can be sampled per dispatch class.
+
+    Records hold references to the dispatch and node and are formatted later,
+    so messages show their state at delivery time rather than when queued.
+    """
+
+    def __init__(self, callback: Callable[[str], None], max_size: int = 10000, interval: float = 0.05):
+        """
+        Create a new instance of DebugPipeline class and start its worker thread.
+
+        Args:
+            callback: Callable that receives formatted messages on the worker thread; records it raises on are
+                counted as failed and skipped
+            max_size: Maximum number of queued records
+            interval: Seconds the worker waits between draining the queue
+        """
+        self._callback: Callable[[str], None] = callback
+        self._max_size: int = max_size
+        self._interval: float = interval
+        self._queue: Deque[Tuple[int, Any, Any]] = deque()
+        self._sample_rates: Dict[Type, int] = {}
+        self._sample_counts: Dict[Type, int] = {}
+        self._dropped: int = 0
+        self._sampled_out: int = 0
+        self._delivered: int = 0
+        self._failed: int = 0
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread = threading.Thread(target=self._run, name='DebugPipeline', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'DebugPipeline':
+        """Return self so the pipeline can be used as a context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the pipeline when leaving the context."""
+        self.stop()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return counters for the pipeline.
+
+        Returns:
+            Dict[str, int]: Queued, delivered, failed, dropped and sampled-out record counts
+        """
+        return {
+            'queued': len(self._queue),
+            'delivered': self._delivered,
+            'failed': self._failed,
+            'dropped': self._dropped,
+            'sampled_out': self._sampled_out
+        }
+
+    def set_sample_rate(self, dispatch_type: Type, rate: int) -> 'DebugPipeline':
+        """
+        Only deliver one in every `rate` records about dispatches of the given
+        class. A rate of 1 or less delivers every record.
+
+        Args:
+            dispatch_type: Exact dispatch class to sample
+            rate: Deliver one record out of this many
+
+        Returns:
+            DebugPipeline: Self for method chaining
+        """
+        if rate <= 1:
+            self._sample_rates.pop(dispatch_type, None)
+        else:
+            self._sample_rates[dispatch_type] = rate
+
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker thread after it delivers the records already queued.
+
+        Args:
+            timeout: Optional number of seconds to wait for the worker
+        """
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def submit(self, code: int, subject: Any = None, node: Any = None) -> bool:
+        """
+        Queue a debug record without formatting it.
+
+        Args:
+            code: One of the DEBUG_* constants
+            subject: Dispatch, node key or message the record is about
+            node: Node the record is about
+
+        Returns:
+            bool: True if the record was queued, False if it was sampled out or dropped
+        """
+        if self._sample_rates:
+            rate = self._sample_rates.get(subject.__class__)
+
+            if rate is not None:
+                count = self._sample_counts.get(subject.__class__, 0)
+                self._sample_counts[subject.__class__] = count + 1
+
+                if count % rate != 0:
+                    self._sampled_out += 1
+
+                    return False
+
+        if len(self._queue) >= self._max_size:
+            self._dropped += 1
+
+            return False
+
+        self._queue.append((code, subject, node))
+
+        return True
+
+    def _drain(self) -> None:
+        """
+        Format and deliver every queued record.
+        """
+        while True:
+            try:
+                code, subject, node = self._queue.popleft()
+            except IndexError:
+                return
+
+            try:
+                self._callback(format_debug_record(code, subject, node))
+            except Exception:
+                self._failed += 1
+
+                continue
+
+            self._delivered += 1
+
+    def _run(self) -> None:
+        """
+        Worker loop that drains the queue until stopped.
+        """
+        while not self._stop.wait(self._interval):
+            self._drain()
+
+        self._drain()
\ No newline at end of file
@@ -1,30 +1,48 @@
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import List, Any, Optional
+from typing import List, Any, Hashable, Optional
+from .dispatch_trace import DispatchTrace, TRACE_VALIDATED
+
+# Flag bits packed into DispatchBase._flags
+FLAG_CONSUMABLE = 1
+FLAG_STATEFUL = 2
+FLAG_CONSUMED = 4
+FLAG_VALID = 8
 
 
 class DispatchBase(ABC):
     """
     Abstract class to provide contract for all dispatches used with the chain system.
+
+    Instances use __slots__ with the boolean states packed into a single int and
+    the results list only allocated once a result is set. Subclasses that don't
+    declare __slots__ get a __dict__ as usual; declaring __slots__ (even empty)
+    keeps their instances compact as well.
     """
 
+    __slots__ = ('_flags', '_results', '_called_perf_ns', '_called_time_ns', '_trace')
+
+    # Whether make_valid() records timestamps, see toggle_timestamps()
+    _do_timestamps: bool = True
+
     def __init__(self):
         """Initialize a new DispatchBase instance."""
-        self._is_consumable: bool = False
-        self._is_stateful: bool = False
-        self._is_consumed: bool = False
-        self._results: List[Any] = []
-        self._is_valid: bool = False
-        self._called_date_time: Optional[datetime] = None
+        self._flags: int = 0
+        self._results: Optional[List[Any]] = None
+        self._called_perf_ns: int = 0
+        self._called_time_ns: int = 0
+        self._trace: Optional[DispatchTrace] = None
 
     def __str__(self) -> str:
         """Serialize the DispatchBase class to a string."""
-        called_date_time = self._called_date_time.strftime("%Y-%m-%d %H:%M:%S") if self._called_date_time else 'N/A'
+        called_date_time = self.get_called_date_time()
+        called_date_time = called_date_time.strftime("%Y-%m-%d %H:%M:%S") if called_date_time else 'N/A'
 
         return (f"{self.__class__.__name__}{{ \"calledDateTime\": \"{called_date_time}\", "
-                f"\"isConsumable\": \"{self._is_consumable}\", "
-                f"\"isStateful\": \"{self._is_stateful}\", "
-                f"\"isConsumed\": \"{self._is_consumed}\" }}")
+                f"\"isConsumable\": \"{self.is_consumable()}\", "
+                f"\"isStateful\": \"{self.is_stateful()}\", "
+                f"\"isConsumed\": \"{self.is_consumed()}\" }}")
 
     def consume(self) -> bool:
         """
@@ -34,20 +52,108 @@ class DispatchBase(ABC):
         Returns:
             bool: True if dispatch was consumed, False otherwise
         """
-        if self._is_consumable and not self._is_consumed:
-            self._is_consumed = True
+        if self._flags & (FLAG_CONSUMABLE | FLAG_CONSUMED) == FLAG_CONSUMABLE:
+            self._flags |= FLAG_CONSUMED
             return True
 
         return False
 
-    def get_called_date_time(self) -> datetime:
+    @classmethod
+    def toggle_timestamps(cls, do_timestamps: bool) -> None:
+        """
+        Toggle whether make_valid() records timestamps for this class and its
+        subclasses. Without timestamps, get_called_date_time() and get_age_ns()
+        return None.
+
+        Args:
+            do_timestamps: Toggle for recording timestamps
+        """
+        cls._do_timestamps = do_timestamps
+
+    def enable_trace(self) -> 'DispatchBase':
+        """
+        Attach a DispatchTrace to the dispatch, which records validation and, when
+        traversed with ChainHelper.traverse(), entry to and exit from every node
+        and consumption. Enable before calling make_valid() so validation is
+        recorded; if the dispatch already has a validation timestamp it is used.
+
+        Returns:
+            DispatchBase: Self for method chaining
+        """
+        if self._trace is None:
+            self._trace = DispatchTrace()
+
+            if self._called_perf_ns:
+                self._trace.record(TRACE_VALIDATED, None, None, self._called_perf_ns)
+
+        return self
+
+    def get_age_ns(self) -> Optional[int]:
         """
-        Return time the dispatch was marked valid.
+        Return the nanoseconds elapsed since the dispatch was marked valid,
+        measured with the monotonic time.perf_counter_ns() clock.
 
         Returns:
-            datetime: The datetime when the dispatch was marked valid
+            Optional[int]: Age of the dispatch, or None if no timestamp was recorded
         """
-        return self._called_date_time
+        if not self._called_perf_ns:
+            return None
+
+        return time.perf_counter_ns() - self._called_perf_ns
+
+    def get_called_date_time(self) -> Optional[datetime]:
+        """
+        Return time the dispatch was marked valid. The datetime is built from the
+        recorded time.time_ns() value on each call.
+
+        Returns:
+            Optional[datetime]: The datetime when the dispatch was marked valid, or None if not recorded
+        """
+        if not self._called_time_ns:
+            return None
+
+        seconds, nanoseconds = divmod(self._called_time_ns, 1_000_000_000)
+
+        return datetime.fromtimestamp(seconds, timezone.utc).replace(microsecond=nanoseconds // 1000)
+
+    def get_called_perf_ns(self) -> int:
+        """
+        Return the time.perf_counter_ns() value recorded when the dispatch was
+        marked valid, for comparing against other monotonic timestamps.
+
+        Returns:
+            int: Monotonic timestamp, or 0 if not recorded
+        """
+        return self._called_perf_ns
+
+    def get_called_time_ns(self) -> int:
+        """
+        Return the time.time_ns() value recorded when the dispatch was marked valid.
+
+        Returns:
+            int: Wall-clock timestamp, or 0 if not recorded
+        """
+        return self._called_time_ns
+
+    def get_routing_key(self) -> Optional[Hashable]:
+        """
+        Return the key that ShardedExecutor uses to pick a lane for the dispatch.
+        Dispatches with equal keys are traversed in submission order. Returns
+        None by default; override in subclasses that carry an entity identifier.
+
+        Returns:
+            Optional[Hashable]: Routing key, or None to use the first lane
+        """
+        return None
+
+    def get_trace(self) -> Optional[DispatchTrace]:
+        """
+        Return the trace attached with enable_trace().
+
+        Returns:
+            Optional[DispatchTrace]: Trace of the dispatch, or None if tracing isn't enabled
+        """
+        return self._trace
 
     def get_results(self) -> Any:
         """
@@ -57,7 +163,7 @@ class DispatchBase(ABC):
         Returns:
             Any: The results stored in the dispatch
         """
-        if len(self._results) < 1:
+        if not self._results:
             return None
 
         return self._results
@@ -81,7 +187,7 @@ class DispatchBase(ABC):
         Returns:
             bool: True if dispatch can be consumed, False otherwise
         """
-        return self._is_consumable
+        return (self._flags & FLAG_CONSUMABLE) != 0
 
     def is_consumed(self) -> bool:
         """
@@ -91,7 +197,7 @@ class DispatchBase(ABC):
         Returns:
             bool: True if dispatch has been consumed, False otherwise
         """
-        return self._is_consumed
+        return (self._flags & FLAG_CONSUMED) != 0
 
     def is_stateful(self) -> bool:
         """
@@ -100,7 +206,7 @@ class DispatchBase(ABC):
         Returns:
             bool: True if dispatch is stateful, False otherwise
         """
-        return self._is_stateful
+        return (self._flags & FLAG_STATEFUL) != 0
 
     def is_valid(self) -> bool:
         """
@@ -109,7 +215,7 @@ class DispatchBase(ABC):
         Returns:
             bool: True if dispatch is valid, False otherwise
         """
-        return self._is_valid
+        return (self._flags & FLAG_VALID) != 0
 
     def make_consumable(self) -> 'DispatchBase':
         """
@@ -118,7 +224,7 @@ class DispatchBase(ABC):
         Returns:
             DispatchBase: Self for method chaining
         """
-        self._is_consumable = True
+        self._flags |= FLAG_CONSUMABLE
         return self
 
     def make_stateful(self) -> 'DispatchBase':
@@ -128,18 +234,29 @@ class DispatchBase(ABC):
         Returns:
             DispatchBase: Self for method chaining
         """
-        self._is_stateful = True
+        self._flags |= FLAG_STATEFUL
         return self
 
     def make_valid(self) -> 'DispatchBase':
         """
-        Set dispatch as valid and record the current date and time in UTC offset.
+        Set dispatch as valid and, unless disabled with toggle_timestamps(), record
+        the current time.time_ns() and time.perf_counter_ns() values. The UTC
+        datetime is only built if get_called_date_time() is called. Traced
+        dispatches always record the monotonic value.
 
         Returns:
             DispatchBase: Self for method chaining
         """
-        self._called_date_time = datetime.now(timezone.utc)
-        self._is_valid = True
+        if self._do_timestamps:
+            self._called_time_ns = time.time_ns()
+            self._called_perf_ns = time.perf_counter_ns()
+        elif self._trace is not None:
+            self._called_perf_ns = time.perf_counter_ns()
+
+        if self._trace is not None:
+            self._trace.record(TRACE_VALIDATED, None, None, self._called_perf_ns)
+
+        self._flags |= FLAG_VALID
         return self
 
     def num_results(self) -> int:
@@ -149,6 +266,9 @@ class DispatchBase(ABC):
         Returns:
             int: Number of results stored
         """
+        if self._results is None:
+            return 0
+
         return len(self._results)
 
     def set_result(self, result: Any) -> 'DispatchBase':
@@ -162,7 +282,7 @@ class DispatchBase(ABC):
         Returns:
             DispatchBase: Self for method chaining
         """
-        if not self._is_stateful:
+        if not self._flags & FLAG_STATEFUL or self._results is None:
             self._results = [result]
         else:
             self._results.append(result)
@@ -0,0 +1,246 @@
+import queue
+import threading
+import time
+from collections import deque
+from .dispatch_base import DispatchBase
+from .chain_helper import ChainHelper
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# Backpressure policy constants
+BUS_BLOCK = 0
+BUS_DROP_OLDEST = 1
+BUS_DROP_NEWEST = 2
+BUS_REJECT = 3
+
+
+class DispatchBus:
+    """
+    Class to traverse a chain from a pool of worker threads. Producers submit
+    dispatches onto a bounded queue and return straight away; workers take
+    them off in submission order and traverse the chain with them. When the
+    queue is full, submit() applies the backpressure policy: block until there
+    is room, drop the oldest queued dispatch, drop the submitted dispatch, or
+    raise queue.Full.
+
+    With more than one worker, dispatches are traversed concurrently and can
+    finish out of submission order.
+    """
+
+    def __init__(self, chain: ChainHelper, workers: int = 1, max_size: int = 1000, policy: int = BUS_BLOCK,
+                 sender: Any = None, error_handler: Optional[Callable[[DispatchBase, Exception], None]] = None):
+        """
+        Create a new instance of DispatchBus class and start its worker threads.
+
+        Args:
+            chain: Chain to traverse, or any object with the same traverse() method
+            workers: Number of worker threads
+            max_size: Maximum number of queued dispatches
+            policy: One of the BUS_* constants, applied when the queue is full
+            sender: Optional sender data to pass to linked nodes
+            error_handler: Optional callable that receives dispatches whose traversal raised, and the exception;
+                exceptions raised by the handler itself are counted and otherwise ignored
+
+        Raises:
+            ValueError: If workers or max_size is less than 1, or policy is unknown.
+        """
+        if workers < 1:
+            raise ValueError("Workers to DispatchBus() must be a positive integer")
+
+        if max_size < 1:
+            raise ValueError("Maximum size to DispatchBus() must be a positive integer")
+
+        if policy not in (BUS_BLOCK, BUS_DROP_OLDEST, BUS_DROP_NEWEST, BUS_REJECT):
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+
+        self._chain: ChainHelper = chain
+        self._max_size: int = max_size
+        self._policy: int = policy
+        self._sender: Any = sender
+        self._error_handler: Optional[Callable[[DispatchBase, Exception], None]] = error_handler
+        self._queue: Deque[Tuple[DispatchBase, int]] = deque()
+        self._lock: threading.Lock = threading.Lock()
+        self._not_empty: threading.Condition = threading.Condition(self._lock)
+        self._not_full: threading.Condition = threading.Condition(self._lock)
+        self._idle: threading.Condition = threading.Condition(self._lock)
+        self._unfinished: int = 0
+        self._is_stopping: bool = False
+        self._max_depth: int = 0
+        self._submitted: int = 0
+        self._processed: int = 0
+        self._dropped: int = 0
+        self._rejected: int = 0
+        self._errors: int = 0
+        self._handler_errors: int = 0
+        self._wait_ns: int = 0
+        self._max_wait_ns: int = 0
+        self._threads: List[threading.Thread] = [
+            threading.Thread(target=self._run, name=f'DispatchBus-{i}', daemon=True) for i in range(workers)]
+
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> 'DispatchBus':
+        """Return self so the bus can be used as a context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the bus when leaving the context."""
+        self.stop()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return counters for the bus. Wait times are measured from submission until
+        a worker takes the dispatch off the queue.
+
+        Returns:
+            Dict[str, int]: Queue depths, dispatch counts and queue wait times
+        """
+        with self._lock:
+            taken = self._processed + self._errors + self._unfinished - len(self._queue)
+
+            return {
+                'depth': len(self._queue),
+                'max_depth': self._max_depth,
+                'submitted': self._submitted,
+                'processed': self._processed,
+                'dropped': self._dropped,
+                'rejected': self._rejected,
+                'errors': self._errors,
+                'handler_errors': self._handler_errors,
+                'wait_ns': self._wait_ns,
+                'max_wait_ns': self._max_wait_ns,
+                'mean_wait_ns': self._wait_ns // taken if taken > 0 else 0
+            }
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued dispatch has been traversed.
+
+        Args:
+            timeout: Optional number of seconds to wait
+
+        Returns:
+            bool: True if the bus is idle, False if the timeout expired first
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting dispatches and stop the worker threads after they traverse
+        the dispatches already queued.
+
+        Args:
+            timeout: Optional number of seconds to wait for each worker
+        """
+        with self._lock:
+            self._is_stopping = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def submit(self, dispatch: DispatchBase, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a dispatch for traversal, applying the backpressure policy if the
+        queue is full.
+
+        Args:
+            dispatch: DispatchBase object to distribute to linked nodes
+            timeout: Optional number of seconds to wait for room under BUS_BLOCK
+
+        Returns:
+            bool: True if the dispatch was queued, False if it was dropped or the wait timed out
+
+        Raises:
+            queue.Full: If the queue is full under BUS_REJECT
+            RuntimeError: If the bus has been stopped
+        """
+        with self._lock:
+            if self._is_stopping:
+                raise RuntimeError("Attempted to submit to a stopped DispatchBus")
+
+            if len(self._queue) >= self._max_size:
+                if self._policy == BUS_BLOCK:
+                    if not self._not_full.wait_for(
+                            lambda: len(self._queue) < self._max_size or self._is_stopping, timeout):
+                        self._rejected += 1
+
+                        return False
+
+                    if self._is_stopping:
+                        raise RuntimeError("Attempted to submit to a stopped DispatchBus")
+                elif self._policy == BUS_DROP_OLDEST:
+                    self._queue.popleft()
+                    self._unfinished -= 1
+                    self._dropped += 1
+                elif self._policy == BUS_DROP_NEWEST:
+                    self._dropped += 1
+
+                    return False
+                else:
+                    self._rejected += 1
+
+                    raise queue.Full
+
+            self._queue.append((dispatch, time.perf_counter_ns()))
+            self._unfinished += 1
+            self._submitted += 1
+
+            if len(self._queue) > self._max_depth:
+                self._max_depth = len(self._queue)
+
+            self._not_empty.notify()
+
+        return True
+
+    def _run(self) -> None:
+        """
+        Worker loop that traverses queued dispatches until stopped and drained.
+        """
+        traverse = self._chain.traverse
+
+        while True:
+            with self._lock:
+                while not self._queue:
+                    if self._is_stopping:
+                        return
+
+                    self._not_empty.wait()
+
+                dispatch, queued_ns = self._queue.popleft()
+                self._not_full.notify()
+
+                wait_ns = time.perf_counter_ns() - queued_ns
+                self._wait_ns += wait_ns
+
+                if wait_ns > self._max_wait_ns:
+                    self._max_wait_ns = wait_ns
+
+            is_processed = False
+            is_handled = True
+
+            try:
+                traverse(dispatch, self._sender)
+                is_processed = True
+            except Exception as e:
+                if self._error_handler is not None:
+                    try:
+                        self._error_handler(dispatch, e)
+                    except Exception:
+                        is_handled = False
+            finally:
+                with self._lock:
+                    if is_processed:
+                        self._processed += 1
+                    else:
+                        self._errors += 1
+
+                    if not is_handled:
+                        self._handler_errors += 1
+
+                    self._unfinished -= 1
+
+                    if self._unfinished == 0:
+                        self._idle.notify_all()
\ No newline at end of file
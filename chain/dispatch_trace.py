@@ -0,0 +1,91 @@
+from typing import List, Any, Dict, Optional, Tuple
+
+# Trace event constants
+TRACE_VALIDATED = 0
+TRACE_NODE_ENTER = 1
+TRACE_NODE_EXIT = 2
+TRACE_CONSUMED = 3
+TRACE_BYPASSED = 4
+
+
+class DispatchTrace:
+    """
+    Class to hold the lifecycle timestamps of a single dispatch. Entries are
+    recorded as plain tuples with time.perf_counter_ns() timestamps and only
+    turned into a latency breakdown when exported.
+    """
+
+    __slots__ = ('_events',)
+
+    def __init__(self):
+        """Initialize a new DispatchTrace instance."""
+        self._events: List[Tuple[int, Optional[str], Optional[str], int]] = []
+
+    def get_events(self) -> List[Tuple[int, Optional[str], Optional[str], int]]:
+        """
+        Return the raw trace entries in the order they were recorded.
+
+        Returns:
+            List[Tuple[int, Optional[str], Optional[str], int]]: Event, node key, node version and timestamp
+        """
+        return self._events
+
+    def record(self, event: int, key: Optional[str], version: Optional[str], timestamp_ns: int) -> None:
+        """
+        Record a trace entry.
+
+        Args:
+            event: One of the TRACE_* constants
+            key: Key of the node involved, None for validation
+            version: Version of the node involved, None for validation
+            timestamp_ns: Value of time.perf_counter_ns() when the event happened
+        """
+        self._events.append((event, key, version, timestamp_ns))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the trace as a per-dispatch latency breakdown. Node offsets are
+        relative to validation, or to the first recorded entry if the dispatch
+        was traced after it was validated without a timestamp.
+
+        Returns:
+            Dict[str, Any]: Totals, consumption details, one entry per node visit and bypassed node keys
+        """
+        ret = {
+            'validated_ns': None,
+            'consumed_by': None,
+            'consumed_ns': None,
+            'total_ns': 0,
+            'nodes': [],
+            'bypassed': []
+        }
+
+        if not self._events:
+            return ret
+
+        origin = self._events[0][3]
+        entered: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+
+        for event, key, version, timestamp_ns in self._events:
+            if event == TRACE_VALIDATED:
+                origin = timestamp_ns
+                ret['validated_ns'] = timestamp_ns
+            elif event == TRACE_NODE_ENTER:
+                entered[(key, version)] = timestamp_ns
+            elif event == TRACE_NODE_EXIT:
+                start_ns = entered.pop((key, version), timestamp_ns)
+                ret['nodes'].append({
+                    'key': key,
+                    'version': version,
+                    'offset_ns': start_ns - origin,
+                    'duration_ns': timestamp_ns - start_ns
+                })
+            elif event == TRACE_CONSUMED:
+                ret['consumed_by'] = key
+                ret['consumed_ns'] = timestamp_ns - origin
+            elif event == TRACE_BYPASSED:
+                ret['bypassed'].append(key)
+
+        ret['total_ns'] = self._events[-1][3] - origin
+
+        return ret
\ No newline at end of file
@@ -0,0 +1,119 @@
+from array import array
+from .chain_observer import ChainObserver, OUTCOME_ERROR, OUTCOME_NAMES
+from .node_base import NodeBase
+from .dispatch_base import DispatchBase
+from typing import List, Any, Callable, Dict, Optional, Type
+
+
+class FlightRecorder(ChainObserver):
+    """
+    Observer that keeps the last N node visits in fixed-size, preallocated ring
+    buffers, storing only references and integers so recording doesn't allocate
+    or format anything. The contents are only turned into readable entries when
+    dumped, on demand or automatically, at a limited rate, when a node raises.
+
+    Concurrent traversals share the write position without locking, so under
+    contention an entry can occasionally be overwritten early.
+    """
+
+    def __init__(self, size: int = 1024):
+        """
+        Create a new instance of FlightRecorder class.
+
+        Args:
+            size: Number of node visits to keep
+
+        Raises:
+            ValueError: If size is less than 1.
+        """
+        if size < 1:
+            raise ValueError("Size to FlightRecorder() must be a positive integer")
+
+        self._size: int = size
+        self._position: int = 0
+        self._types: List[Optional[Type[DispatchBase]]] = [None] * size
+        self._keys: List[Optional[str]] = [None] * size
+        self._outcomes: array = array('b', bytes(size))
+        self._durations: array = array('q', bytes(8 * size))
+        self._dump_handler: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self._dump_interval_ns: int = 0
+        self._last_dump_ns: Optional[int] = None
+        self._suppressed_dumps: int = 0
+
+    def dump(self) -> List[Dict[str, Any]]:
+        """
+        Return the recorded node visits, oldest first.
+
+        Returns:
+            List[Dict[str, Any]]: Dispatch class name, node key, outcome and duration of each visit
+        """
+        position = self._position
+        count = min(position, self._size)
+        ret = []
+
+        for i in range(position - count, position):
+            slot = i % self._size
+            dispatch_type = self._types[slot]
+
+            ret.append({
+                'dispatch': dispatch_type.__name__ if dispatch_type is not None else None,
+                'key': self._keys[slot],
+                'outcome': OUTCOME_NAMES.get(self._outcomes[slot], self._outcomes[slot]),
+                'duration_ns': self._durations[slot]
+            })
+
+        return ret
+
+    def on_node(self, node: NodeBase, dispatch: DispatchBase, start_ns: int, end_ns: int, outcome: int) -> None:
+        """
+        Record a node visit, dumping the buffer to the dump handler if the node raised.
+
+        Args:
+            node: Node that processed the dispatch
+            dispatch: Dispatch that was processed
+            start_ns: Timestamp taken before calling the node
+            end_ns: Timestamp taken after the node returned or raised
+            outcome: One of the OUTCOME_* constants
+        """
+        slot = self._position % self._size
+        self._position += 1
+        self._types[slot] = dispatch.__class__
+        self._keys[slot] = node.get_key()
+        self._outcomes[slot] = outcome
+        self._durations[slot] = end_ns - start_ns
+
+        if outcome == OUTCOME_ERROR and self._dump_handler is not None:
+            if self._last_dump_ns is not None and end_ns - self._last_dump_ns < self._dump_interval_ns:
+                self._suppressed_dumps += 1
+            else:
+                self._last_dump_ns = end_ns
+                self._dump_handler(self.dump())
+
+    def get_suppressed_dumps(self) -> int:
+        """
+        Return the number of automatic dumps skipped because of the dump interval.
+
+        Returns:
+            int: Number of node exceptions that didn't trigger a dump
+        """
+        return self._suppressed_dumps
+
+    def set_dump_handler(self, callback: Optional[Callable[[List[Dict[str, Any]]], None]],
+                         interval: float = 1.0) -> 'FlightRecorder':
+        """
+        Set a callback that receives a dump when a node raises. Dumps are made on
+        the traversing thread, so they are limited to one per interval; further
+        exceptions within the interval are only counted, keeping a node that
+        fails on every dispatch from paying for a dump on every call.
+
+        Args:
+            callback: Callable that receives the output of dump(), or None to disable
+            interval: Minimum number of seconds between automatic dumps
+
+        Returns:
+            FlightRecorder: Self for method chaining
+        """
+        self._dump_handler = callback
+        self._dump_interval_ns = int(interval * 1e9)
+        self._last_dump_ns = None
+        return self
\ No newline at end of file
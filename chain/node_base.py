@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Type
+from typing import Any, List, Optional, Tuple, Type
 from .dispatch_base import DispatchBase
 
 
@@ -26,15 +26,29 @@ class NodeBase(ABC):
     Abstract class to provide contract for all nodes used with the chain system.
     """
 
+    __slots__ = ('_key', '_version', '_dispatch_types', '_is_cpu_bound')
+
     def __init__(self):
         """Initialize a new NodeBase instance."""
         self._key: Optional[str] = None
         self._version: Optional[str] = None
+        self._dispatch_types: Tuple[Type[DispatchBase], ...] = ()
+        self._is_cpu_bound: bool = False
 
     def __str__(self) -> str:
         """Serialize object as a string."""
         return f"{self.__class__.__name__}{{ \"key\": \"{self._key}\", \"version\": \"{self._version}\" }}"
 
+    def get_dispatch_types(self) -> Tuple[Type[DispatchBase], ...]:
+        """
+        Return the dispatch classes the node has declared it handles. An empty
+        tuple means the node receives every dispatch.
+
+        Returns:
+            Tuple[Type[DispatchBase], ...]: Declared dispatch classes
+        """
+        return self._dispatch_types
+
     def get_key(self) -> str:
         """Return the node key value."""
         return self._key
@@ -43,6 +57,32 @@ class NodeBase(ABC):
         """Return the node version value."""
         return self._version
 
+    def handles_dispatch_type(self, dispatch_type: Type[DispatchBase]) -> bool:
+        """
+        Return whether the node should receive dispatches of the given class. Nodes
+        that haven't declared any dispatch classes handle every dispatch, otherwise
+        the class (or one of its bases) must be among the declared classes.
+
+        Args:
+            dispatch_type: Concrete class of the dispatch being traversed
+
+        Returns:
+            bool: True if node handles the dispatch class, False otherwise
+        """
+        if not self._dispatch_types:
+            return True
+
+        return issubclass(dispatch_type, self._dispatch_types)
+
+    def is_cpu_bound(self) -> bool:
+        """
+        Return whether the node is marked as CPU-bound.
+
+        Returns:
+            bool: True if node is CPU-bound, False otherwise
+        """
+        return self._is_cpu_bound
+
     def is_valid(self) -> bool:
         """
         Return whether the node is considered valid. This means that there are
@@ -53,6 +93,18 @@ class NodeBase(ABC):
         """
         return bool(self._key) and bool(self._version)
 
+    def make_cpu_bound(self) -> 'NodeBase':
+        """
+        Mark the node as CPU-bound. When a ChainHelper has a process executor,
+        traverse_parallel() runs CPU-bound nodes in worker processes, so the node,
+        the sender and the dispatch must all be picklable.
+
+        Returns:
+            NodeBase: Self for method chaining
+        """
+        self._is_cpu_bound = True
+        return self
+
     @abstractmethod
     def process(self, sender: Any, dispatch: DispatchBase) -> None:
         """
@@ -64,6 +116,37 @@ class NodeBase(ABC):
         """
         pass
 
+    def process_batch(self, sender: Any, dispatches: List[DispatchBase]) -> None:
+        """
+        Handle processing of several dispatches in one call. Called by
+        ChainHelper.traverse_batch() with the dispatches of a batch that the node
+        handles and that haven't been consumed, in submission order. Calls
+        process() for each dispatch by default; override in nodes that can
+        amortize work across dispatches, such as a single database insert.
+
+        Args:
+            sender: Sender data, optional and thus can be None
+            dispatches: Dispatch objects to process
+        """
+        for dispatch in dispatches:
+            self.process(sender, dispatch)
+
+    def set_dispatch_types(self, *classes: Type[DispatchBase]) -> 'NodeBase':
+        """
+        Declare which DispatchBase subclasses the node handles. ChainHelper objects
+        use this to skip the node for unrelated dispatches, so it should be set
+        before the node is linked to a chain. Calling with no classes resets the
+        node to receive every dispatch.
+
+        Args:
+            *classes: DispatchBase subclasses handled by the node
+
+        Returns:
+            NodeBase: Self for method chaining
+        """
+        self._dispatch_types = tuple(classes)
+        return self
+
     def set_key(self, key: str) -> 'NodeBase':
         """
         Set the node key value.
@@ -0,0 +1,128 @@
+from .dispatch_base import DispatchBase
+from .dispatch_bus import DispatchBus, BUS_BLOCK
+from .chain_helper import ChainHelper
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class ShardedExecutor:
+    """
+    Class to traverse a chain on several lanes, each a DispatchBus with a single
+    worker thread. Each dispatch goes to the lane picked by hashing its routing
+    key, so dispatches with the same key are traversed one at a time in
+    submission order, while dispatches with different keys can run in parallel.
+    Dispatches without a routing key all go to the first lane.
+
+    Under BUS_DROP_OLDEST or BUS_DROP_NEWEST a dropped dispatch leaves a gap in
+    the order of its key, but never reorders it.
+    """
+
+    def __init__(self, chain: ChainHelper, lanes: int = 4, max_size: int = 1000, policy: int = BUS_BLOCK,
+                 sender: Any = None, error_handler: Optional[Callable[[DispatchBase, Exception], None]] = None,
+                 key_func: Optional[Callable[[DispatchBase], Optional[Hashable]]] = None):
+        """
+        Create a new instance of ShardedExecutor class and start its lanes.
+
+        Args:
+            chain: Chain to traverse, or any object with the same traverse() method
+            lanes: Number of lanes
+            max_size: Maximum number of queued dispatches per lane
+            policy: One of the BUS_* constants, applied when a lane's queue is full
+            sender: Optional sender data to pass to linked nodes
+            error_handler: Optional callable that receives dispatches whose traversal raised, and the exception
+            key_func: Optional callable that returns the routing key of a dispatch, instead of get_routing_key()
+
+        Raises:
+            ValueError: If lanes is less than 1, or a DispatchBus argument is invalid.
+        """
+        if lanes < 1:
+            raise ValueError("Lanes to ShardedExecutor() must be a positive integer")
+
+        self._key_func: Optional[Callable[[DispatchBase], Optional[Hashable]]] = key_func
+        self._lanes: List[DispatchBus] = []
+
+        try:
+            for _ in range(lanes):
+                self._lanes.append(DispatchBus(chain, 1, max_size, policy, sender, error_handler))
+        except ValueError:
+            self.stop()
+
+            raise
+
+    def __enter__(self) -> 'ShardedExecutor':
+        """Return self so the executor can be used as a context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the executor when leaving the context."""
+        self.stop()
+
+    def get_lane(self, dispatch: DispatchBase) -> int:
+        """
+        Return the index of the lane the given dispatch is submitted to.
+
+        Args:
+            dispatch: DispatchBase object to route
+
+        Returns:
+            int: Lane index
+        """
+        key = self._key_func(dispatch) if self._key_func is not None else dispatch.get_routing_key()
+
+        return 0 if key is None else hash(key) % len(self._lanes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return counters for the executor.
+
+        Returns:
+            Dict[str, Any]: Per-lane DispatchBus counters, and the queue depth and dispatch counts summed over lanes
+        """
+        lanes = [lane.get_stats() for lane in self._lanes]
+
+        ret: Dict[str, Any] = {name: sum(stats[name] for stats in lanes)
+                               for name in ('depth', 'submitted', 'processed', 'dropped', 'rejected', 'errors',
+                                            'handler_errors')}
+        ret['lanes'] = lanes
+
+        return ret
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every lane has traversed its queued dispatches.
+
+        Args:
+            timeout: Optional number of seconds to wait for each lane
+
+        Returns:
+            bool: True if all lanes are idle, False if a timeout expired first
+        """
+        return all([lane.join(timeout) for lane in self._lanes])
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting dispatches and stop every lane after it traverses the
+        dispatches already queued.
+
+        Args:
+            timeout: Optional number of seconds to wait for each lane's worker
+        """
+        for lane in self._lanes:
+            lane.stop(timeout)
+
+    def submit(self, dispatch: DispatchBase, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a dispatch on the lane for its routing key, applying the backpressure
+        policy if that lane's queue is full.
+
+        Args:
+            dispatch: DispatchBase object to distribute to linked nodes
+            timeout: Optional number of seconds to wait for room under BUS_BLOCK
+
+        Returns:
+            bool: True if the dispatch was queued, False if it was dropped or the wait timed out
+
+        Raises:
+            queue.Full: If the lane's queue is full under BUS_REJECT
+            RuntimeError: If the executor has been stopped
+        """
+        return self._lanes[self.get_lane(dispatch)].submit(dispatch, timeout)
\ No newline at end of file
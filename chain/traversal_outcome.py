@@ -0,0 +1,172 @@
+from typing import Dict, List, Tuple
+
+
+class TraversalOutcome:
+    """
+    Class to report per-node results of a chain traversal.
+
+    Traversal variants that don't raise node exceptions return this instead of
+    a plain bool, recording which nodes completed, which raised, which were
+    skipped because the traversal ran out of time and which were bypassed
+    because their circuit was open.
+    """
+
+    __slots__ = ('_visited', '_errors', '_skipped', '_bypassed', '_status', '__weakref__')
+
+    # Status constants
+    STATUS_BAD = 0
+    STATUS_GOOD = 1
+
+    def __init__(self):
+        """
+        Instantiates a new TraversalOutcome class. Default status is STATUS_BAD.
+        """
+        self._visited = []  # type: List[str]
+        self._errors = []  # type: List[Tuple[str, BaseException]]
+        self._skipped = []  # type: List[str]
+        self._bypassed = []  # type: List[str]
+        self._status = self.STATUS_BAD
+
+    def add_bypassed(self, key: str) -> None:
+        """
+        Records a node that was not called because its circuit was open.
+
+        Args:
+            key: Key of the bypassed node.
+        """
+        self._bypassed.append(key)
+
+    def add_error(self, key: str, error: BaseException) -> None:
+        """
+        Records an exception raised by a node.
+
+        Args:
+            key: Key of the node that raised.
+            error: Exception raised by the node.
+        """
+        self._errors.append((key, error))
+
+    def add_skipped(self, key: str) -> None:
+        """
+        Records a node that did not process the dispatch within the traversal budget.
+
+        Args:
+            key: Key of the skipped node.
+        """
+        self._skipped.append(key)
+
+    def add_visited(self, key: str) -> None:
+        """
+        Records a node that processed the dispatch without raising.
+
+        Args:
+            key: Key of the node that processed the dispatch.
+        """
+        self._visited.append(key)
+
+    def get_bypassed(self) -> List[str]:
+        """
+        Returns the keys of nodes bypassed because their circuit was open, in traversal order.
+
+        Returns:
+            List[str]: List of node keys.
+        """
+        return self._bypassed
+
+    def get_error_counts(self) -> Dict[Tuple[str, str], int]:
+        """
+        Returns the number of exceptions recorded for each node key and exception type.
+
+        Returns:
+            Dict[Tuple[str, str], int]: Counts keyed by node key and exception class name.
+        """
+        ret = {}  # type: Dict[Tuple[str, str], int]
+
+        for key, error in self._errors:
+            ret[(key, error.__class__.__name__)] = ret.get((key, error.__class__.__name__), 0) + 1
+
+        return ret
+
+    def get_errors(self) -> List[Tuple[str, BaseException]]:
+        """
+        Returns the node keys and exceptions of nodes that raised, in traversal order.
+
+        Returns:
+            List[Tuple[str, BaseException]]: List of node keys and exceptions.
+        """
+        return self._errors
+
+    def get_skipped(self) -> List[str]:
+        """
+        Returns the keys of nodes skipped or abandoned once the traversal budget ran out.
+
+        Returns:
+            List[str]: List of node keys.
+        """
+        return self._skipped
+
+    def get_visited(self) -> List[str]:
+        """
+        Returns the keys of nodes that processed the dispatch, in traversal order.
+
+        Returns:
+            List[str]: List of node keys.
+        """
+        return self._visited
+
+    def has_bypassed(self) -> bool:
+        """
+        Returns TRUE if any node was bypassed because its circuit was open.
+
+        Returns:
+            bool: True if bypassed nodes exist, False otherwise.
+        """
+        return len(self._bypassed) > 0
+
+    def has_errors(self) -> bool:
+        """
+        Returns TRUE if any node raised during the traversal.
+
+        Returns:
+            bool: True if errors exist, False otherwise.
+        """
+        return len(self._errors) > 0
+
+    def has_skipped(self) -> bool:
+        """
+        Returns TRUE if any node was skipped because the traversal budget ran out.
+
+        Returns:
+            bool: True if skipped nodes exist, False otherwise.
+        """
+        return len(self._skipped) > 0
+
+    def is_bad(self) -> bool:
+        """
+        Returns TRUE if the current internal status is set to STATUS_BAD.
+
+        Returns:
+            bool: True if status is bad, False otherwise.
+        """
+        return self._status == self.STATUS_BAD
+
+    def is_good(self) -> bool:
+        """
+        Returns TRUE if the current internal status is set to STATUS_GOOD.
+
+        Returns:
+            bool: True if status is good, False otherwise.
+        """
+        return self._status == self.STATUS_GOOD
+
+    def make_bad(self) -> None:
+        """
+        Sets the internal status as STATUS_BAD.
+        """
+        self._status = self.STATUS_BAD
+
+    def make_good(self) -> None:
+        """
+        Sets the internal status as STATUS_GOOD.
+        """
+        self._status = self.STATUS_GOOD
\ No newline at end of file
@@ -9,6 +9,8 @@ class ReturnHelper:
     messages, and multiple results.
     """
 
+    __slots__ = ('_messages', '_results', '_status', '__weakref__')
+
     # Status constants
     STATUS_BAD = 0
     STATUS_GOOD = 1